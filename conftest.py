@@ -0,0 +1,31 @@
+"""Shared pytest configuration for the LLCAR test suite."""
+
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption('--run-slow', action='store_true', default=False,
+                     help="also run tests marked as slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption('--run-slow'):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope='session')
+def yaml_config():
+    """Parsed config.yaml from the repository root, or None if it is missing."""
+    import yaml
+    config_path = Path(__file__).parent / "config.yaml"
+    if not config_path.exists():
+        return None
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
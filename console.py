@@ -5,6 +5,7 @@ LLCAR Interactive Console Launcher
 Quick launcher for the interactive console mode.
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -12,6 +13,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) batch workers must run their task, not main()
+    multiprocessing.freeze_support()
     # Force interactive mode without mutating the global sys.argv
     if "--interactive" not in sys.argv:
         sys.argv.append("--interactive")
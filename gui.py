@@ -22,6 +22,7 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.pipeline import VideoPipeline
+from src.settings import pipeline_kwargs
 
 
 class LLCARGui:
@@ -59,6 +60,7 @@ class LLCARGui:
         # Processing state
         self.is_processing = False
         self.pipeline = None
+        self.config = {}
         self.log_queue = queue.Queue()
         self.current_step = 0
 
@@ -80,7 +82,9 @@ class LLCARGui:
             config_path = Path("config.yaml")
             if config_path.exists():
                 with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.safe_load(f) or {}
+                # Kept for the pipeline settings not shown in the window
+                self.config = config
 
                 self.language.set(config.get('language', 'en'))
                 self.model_variant.set(config.get('model_variant', 'default'))
@@ -425,13 +429,14 @@ class LLCARGui:
 
             # Initialize pipeline
             self.log("Initializing pipeline...")
-            self.pipeline = VideoPipeline(
+            self.pipeline = VideoPipeline(**pipeline_kwargs(
+                self.config,
                 language=language,
                 model_variant=model_var,
                 hf_token=hf_token,
                 device=device,
                 output_dir=output_dir
-            )
+            ))
 
             # Determine if input is video or audio
             input_ext = Path(input_path).suffix.lower()
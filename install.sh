@@ -104,7 +104,7 @@ fi
 # Test installation
 echo ""
 echo "Testing installation..."
-if python3 test_pipeline.py; then
+if python3 -c "from src.pipeline import VideoPipeline"; then
     echo ""
     echo "=============================================="
     echo "Installation completed successfully!"
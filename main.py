@@ -9,6 +9,7 @@ import argparse
 import sys
 import os
 import logging
+import multiprocessing
 from pathlib import Path
 import yaml
 from dotenv import load_dotenv
@@ -17,6 +18,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.pipeline import VideoPipeline
+from src.settings import pipeline_kwargs
 
 
 def setup_logging(level: str = "INFO", log_file: str = None):
@@ -267,22 +269,22 @@ Examples:
     keyword_method = args.keyword_method or config.get('keywords', {}).get('method', 'tfidf')
     top_keywords = args.top_keywords or config.get('keywords', {}).get('top_n', 10)
 
-    # Audio processing parameters
-    enable_noise_reduction = config.get('audio', {}).get('noise_reduction', True)
+    # Pipeline settings; the values resolved above override config
+    settings = pipeline_kwargs(
+        config,
+        language=language,
+        model_variant=model_variant,
+        hf_token=hf_token,
+        device=device,
+        output_dir=output_dir
+    )
 
     try:
         # Initialize pipeline
         logger.info(f"Initializing pipeline with language={language}, model={model_variant}, device={device}")
-        if enable_noise_reduction:
+        if settings['enable_noise_reduction']:
             logger.info("Audio noise reduction: ENABLED")
-        pipeline = VideoPipeline(
-            language=language,
-            model_variant=model_variant,
-            hf_token=hf_token,
-            device=device,
-            output_dir=output_dir,
-            enable_noise_reduction=enable_noise_reduction
-        )
+        pipeline = VideoPipeline(**settings)
 
         # Process input
         if args.video:
@@ -336,4 +338,6 @@ Examples:
 
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) batch workers must run their task, not main()
+    multiprocessing.freeze_support()
     sys.exit(main())
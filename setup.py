@@ -55,6 +55,8 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            "pytest-forked>=1.6.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
@@ -0,0 +1,139 @@
+"""
+Cache Module
+Persists intermediate pipeline results on disk so unchanged inputs are not
+re-processed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.llcar/cache")
+_READ_CHUNK = 1 << 20
+
+
+class PipelineCache:
+    """
+    Directory of JSON entries addressed by hex keys.
+
+    A cache created without a directory is disabled: get() always misses and
+    put() does nothing, so callers need no special casing.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR):
+        """
+        Initialize PipelineCache.
+
+        Args:
+            directory: Cache directory ("~" is expanded), or None to disable
+        """
+        self.directory = Path(directory).expanduser() if directory else None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are read and written."""
+        return self.directory is not None
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Hash JSON-serializable parts into a cache key.
+
+        Args:
+            *parts: Values identifying the cached result
+
+        Returns:
+            Hex digest
+        """
+        payload = json.dumps(
+            parts, ensure_ascii=False, sort_keys=True, separators=(',', ':')
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()
+
+    @staticmethod
+    def file_digest(path: Union[str, Path]) -> str:
+        """
+        Hash a file's content.
+
+        Args:
+            path: File to hash
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Load a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or unreadable entry
+        """
+        if self.directory is None:
+            return None
+        cache_path = self.directory / f"{key}.json"
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+
+    def put(self, key: str, value: Any):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        if self.directory is None:
+            return
+        cache_path = self.directory / f"{key}.json"
+        # Write-then-rename so concurrent batch workers never read a partial entry
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write cache entry {cache_path}: {e}")
+            # Don't leave a partial temporary file behind
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Called with no arguments to produce the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
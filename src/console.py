@@ -7,11 +7,24 @@ Provides a user-friendly menu-driven interface for processing video and audio fi
 import os
 import sys
 import logging
-import platform
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-import json
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Union
+
+from .formats import VIDEO_EXTENSIONS, AUDIO_EXTENSIONS
+from .settings import pipeline_kwargs
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,314 @@ _CYAN = "\033[96m"
 _BLUE = "\033[94m"
 _RESET = "\033[0m"
 
+# Lowercase suffix -> file type ('video' or 'audio')
+_EXT_KIND = MappingProxyType({
+    **{ext: "video" for ext in VIDEO_EXTENSIONS},
+    **{ext: "audio" for ext in AUDIO_EXTENSIONS},
+})
+
+# Suffix tuples for str.endswith() matching during directory scans
+_VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
+_AUDIO_SUFFIXES = tuple(AUDIO_EXTENSIONS)
+_MEDIA_SUFFIXES = _VIDEO_SUFFIXES + _AUDIO_SUFFIXES
+
+_INV_MB = 1.0 / (1 << 20)
+
+# Horizontal rules used by every screen
+_HR = "─" * 70
+_RULE = "=" * 70
+
+# Cursor home + erase display
+_CLEAR = "\033[H\033[2J"
+
+# Append-only log of processing runs, kept in the output directory
+_HISTORY_LOG_NAME = "processing_history.jsonl"
+# Readable JSON export of the session history, also in the output directory
+_HISTORY_EXPORT_NAME = "processing_history.json"
+
+# Answers accepted as "yes" by get_yes_no
+_YES = frozenset(('y', 'yes', 'да', 'д'))
+
+# Defaults for every config key the console reads; merged once in __init__
+_CFG_DEFAULTS = {
+    'language': 'en',
+    'model_variant': 'default',
+    'device': 'auto',
+    'hf_token': None,
+    'history_limit': 10_000,
+    'batch_workers': 4,
+    'output': {'directory': './output', 'formats': ['json', 'txt']},
+    'keywords': {'enabled': True, 'method': 'tfidf', 'top_n': 10},
+    'postprocessing': {'remove_fillers': True, 'remove_profanity': True},
+    'audio': {'sample_rate': 16000, 'channels': 1},
+}
+
+# Output formats understood by VideoPipeline
+_VALID_FORMATS = frozenset(('json', 'txt', 'csv', 'plain', 'plain_text'))
+
+
+def _parse_choice(s: Optional[str], lo: int = 0,
+                  hi: Optional[int] = None) -> Optional[int]:
+    """
+    Parse a numeric answer in a single pass.
+
+    Args:
+        s: User input
+        lo: Smallest accepted value
+        hi: Largest accepted value (None for no upper bound)
+
+    Returns:
+        The parsed integer, or None if it is not a number or out of range
+    """
+    try:
+        n = int(s)
+    except (TypeError, ValueError):
+        return None
+    if n < lo or (hi is not None and n > hi):
+        return None
+    return n
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO 8601 string."""
+    from datetime import datetime
+    return datetime.now().isoformat()
+
+
+def _merge_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Overlay a user config on _CFG_DEFAULTS.
+
+    Nested sections are merged one level deep and always copied, so the
+    defaults are never mutated through the returned dictionary.
+
+    Args:
+        config: User configuration (may be None or partial)
+
+    Returns:
+        Configuration dictionary containing every default key
+    """
+    merged = {key: dict(value) if isinstance(value, dict) else value
+              for key, value in _CFG_DEFAULTS.items()}
+    for key, value in (config or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@lru_cache(maxsize=1)
+def _pipeline_cls():
+    """Import VideoPipeline on first use; it pulls in torch and the ASR stack."""
+    from .pipeline import VideoPipeline
+    return VideoPipeline
+
+
+# Pipeline owned by a batch worker process (see _init_batch_worker)
+_worker_pipeline = None
+
+
+def _init_batch_worker(pipeline_kwargs: Dict[str, Any], num_threads: int):
+    """
+    Build the pipeline once per batch worker process.
+
+    Args:
+        pipeline_kwargs: Keyword arguments for VideoPipeline
+        num_threads: Torch intra-op threads for this worker, so that the
+            workers together do not oversubscribe the CPU
+    """
+    global _worker_pipeline
+    import torch
+    torch.set_num_threads(num_threads)
+    _worker_pipeline = _pipeline_cls()(**pipeline_kwargs)
+
+
+def _process_batch_file(file_type: str, file_path: str, options: Dict[str, Any]) -> float:
+    """
+    Process one batch file inside a worker process.
+
+    Returns:
+        Total processing time in seconds (the full results stay in the
+        worker; the output files are already on disk)
+    """
+    if file_type == "video":
+        # Workers run concurrently, so extract to a unique temp file; the
+        # default <stem>.wav would collide for e.g. talk.mp4 and talk.mkv
+        extracted = _worker_pipeline.prefetch_audio(file_path)
+        results = _worker_pipeline.process_video(file_path, extracted_audio_path=extracted, **options)
+    else:
+        results = _worker_pipeline.process_audio(file_path, **options)
+    return results['total_processing_time']
+
+
+def _build_menu() -> str:
+    """Render the main menu box once; it does not depend on any state."""
+    W = 66  # inner width
+    items = [
+        ("1", "Process single video file",  ""),
+        ("2", "Process single audio file",   ""),
+        ("3", "Batch process multiple files", ""),
+        ("4", "Quick process (drag & drop)",  f"{_GREEN}NEW{_RESET}"),
+        ("5", "View processing history",      ""),
+        ("6", "Configure settings",           ""),
+        ("7", "Show current configuration",   ""),
+        ("8", "Help & Documentation",         ""),
+        ("0", "Exit",                         ""),
+    ]
+    lines = ["", f"  {_BOLD}┌─ Main Menu ─" + "─" * (W - 14) + f"┐{_RESET}"]
+    for num, label, badge in items:
+        badge_text = f" [{badge}]" if badge else ""
+        # Just pad with spaces to roughly align (ANSI codes are not visible)
+        line = f"  {_BOLD}{num}.{_RESET} {label}{badge_text}"
+        lines.append(f"  │{line:<{W + 20}}│")
+    lines.append(f"  {_BOLD}└" + "─" * W + f"┘{_RESET}")
+    return "\n".join(lines) + "\n"
+
+
+_HEADER_STR = "\n".join([
+    "",
+    f"{_BOLD}{_CYAN}{_RULE}{_RESET}",
+    f"{_BOLD}{_CYAN}"
+    "    __    __   ______   ___    ____\n"
+    "   / /   / /  / ____/  /   |  / __ \\\n"
+    "  / /   / /  / /      / /| | / /_/ /\n"
+    " / /___/ /_ / /___   / ___ |/ _, _/\n"
+    "/_____/____/\\____/  /_/  |_/_/ |_|"
+    f"{_RESET}",
+    f"{_DIM}  Video & Audio Processing Pipeline v1.0.0{_RESET}",
+    f"{_CYAN}{_RULE}{_RESET}",
+    "",
+])
+_MENU_STR = _build_menu()
+
+# Pre-encoded copies for writing straight to the UTF-8 byte stream
+_HEADER_BYTES = _HEADER_STR.encode('utf-8')
+_MENU_BYTES = _MENU_STR.encode('utf-8')
+
+# Colorized fragments and templates, built once. Entries with {} fields are
+# filled with str.format; the rest are written as-is.
+_FMT = MappingProxyType({
+    'sysinfo': (f"  {_DIM}OS:{_RESET} {{os}}"
+                f"  {_DIM}Lang:{_RESET} {{lang}}"
+                f"  {_DIM}Device:{_RESET} {{device}}"
+                f"  {_DIM}HF Token:{_RESET} {{token}}\n"),
+    'token_ok': f"{_GREEN}OK{_RESET}",
+    'token_missing': f"{_RED}not set{_RESET}",
+    'error': f"{_RED}{{}}{_RESET}",
+    'warning': f"{_YELLOW}{{}}{_RESET}",
+    'menu_prompt': f"\n  {_BOLD}>{_RESET} Select option",
+    'quick_title': f"\n{_BOLD}Quick Process{_RESET}",
+    'processing': f"\n{_CYAN}Processing...{_RESET}\n",
+    'goodbye': f"\n{_CYAN}Thank you for using LLCAR! Goodbye.{_RESET}\n",
+})
+
+
+def _scan_media(dir_path, suffixes: Tuple[str, ...]) -> List[Tuple[Path, int]]:
+    """
+    List media files in a directory with a single scandir pass.
+
+    Args:
+        dir_path: Directory to scan
+        suffixes: Lower-case file extensions to accept
+
+    Returns:
+        List of (path, size in bytes) tuples sorted by file name
+    """
+    found = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.name.lower().endswith(suffixes) and entry.is_file():
+                found.append((Path(entry.path), entry.stat().st_size))
+    found.sort(key=lambda item: item[0].name)
+    return found
+
+
+def _print_file_list(entries: List[Tuple[Path, int]], batch_size: int = 500):
+    """
+    Print a numbered file listing with sizes in MB.
+
+    Rows are written in batches so very large directories do not build one
+    huge string before anything appears on screen.
+
+    Args:
+        entries: (path, size in bytes) tuples as returned by _scan_media
+        batch_size: Number of rows per write
+    """
+    write = sys.stdout.write
+    for offset in range(0, len(entries), batch_size):
+        batch = entries[offset:offset + batch_size]
+        write("\n".join([
+            f"  {idx}. {path.name} ({size * _INV_MB:.2f} MB)"
+            for idx, (path, size) in enumerate(batch, offset + 1)
+        ]) + "\n")
+    sys.stdout.flush()
+
+
+def _write_static(text: str, data: bytes, suffix: str = ""):
+    """
+    Write a static block (plus an optional dynamic suffix) in one call.
+
+    When stdout is a UTF-8 text stream over a binary buffer, the pre-encoded
+    bytes are written to the buffer directly and skip the text encoder;
+    otherwise (other encodings, captured or replaced streams) the text is
+    written normally.
+
+    Args:
+        text: Static text
+        data: The same text encoded as UTF-8
+        suffix: Dynamic text appended after the static block
+    """
+    out = sys.stdout
+    buffer = getattr(out, 'buffer', None)
+    encoding = getattr(out, 'encoding', None)
+    if buffer is not None and isinstance(encoding, str) and \
+            encoding.lower().replace('-', '').replace('_', '') == 'utf8':
+        out.flush()
+        buffer.write(data + suffix.encode('utf-8') if suffix else data)
+        buffer.flush()
+    else:
+        out.write(text + suffix)
+        out.flush()
+
+
+class _DeferredWriter:
+    """
+    Write console output from a background thread, in submission order.
+
+    Items are strings or zero-argument callables returning a string; callables
+    are formatted on the writer thread. Leaving the context waits until
+    everything queued so far has been written.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="console-writer", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._queue.put(None)
+        self._thread.join()
+        return False
+
+    def put(self, item):
+        """Queue a string or a callable producing one."""
+        self._queue.put(item)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                sys.stdout.write(item() if callable(item) else item)
+                sys.stdout.flush()
+            except Exception as e:
+                logger.error(f"Console output failed: {e}")
+
 
 class InteractiveConsole:
     """
@@ -38,6 +359,9 @@ class InteractiveConsole:
     - Settings management
     """
 
+    __slots__ = ('pipeline', 'config', 'history', 'running',
+                 '_sysinfo', '_env_hf_token')
+
     def __init__(self, pipeline=None, config: Dict[str, Any] = None):
         """
         Initialize interactive console.
@@ -47,62 +371,59 @@ class InteractiveConsole:
             config: Configuration dictionary
         """
         self.pipeline = pipeline
-        self.config = config or {}
-        self.history = []
+        self.config = _merge_config(config)
+        self.history = deque(maxlen=self.config['history_limit'])
         self.running = True
+        # Fixed for the process lifetime; looked up once instead of per redraw
+        import platform  # pulls in subprocess; only needed once here
+        self._sysinfo = f"{platform.system()} {platform.machine()}"
+        self._env_hf_token = os.getenv('HF_TOKEN')
+
+    def _emit(self, lines: List[str]):
+        """Write a block of lines to stdout with a single write call."""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def clear_screen(self):
         """Clear the console screen using ANSI escape codes."""
-        print("\033[2J\033[H", end="", flush=True)
+        if os.environ.get('TERM') == 'dumb':
+            # Terminal without escape sequence support
+            os.system('cls' if os.name == 'nt' else 'clear')
+            return
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
+
+    def _sysinfo_line(self) -> str:
+        """Return the dynamic system info line shown under the header."""
+        has_token = bool(self._hf_token())
+        return _FMT['sysinfo'].format(
+            os=self._sysinfo,
+            lang=self.config['language'],
+            device=self.config['device'],
+            token=_FMT['token_ok'] if has_token else _FMT['token_missing'],
+        )
 
     def print_header(self):
         """Print the application header with system info."""
-        print()
-        print(f"{_BOLD}{_CYAN}" + "=" * 70 + _RESET)
-        print(f"{_BOLD}{_CYAN}"
-              "    __    __   ______   ___    ____\n"
-              "   / /   / /  / ____/  /   |  / __ \\\n"
-              "  / /   / /  / /      / /| | / /_/ /\n"
-              " / /___/ /_ / /___   / ___ |/ _, _/\n"
-              "/_____/____/\\____/  /_/  |_/_/ |_|"
-              f"{_RESET}")
-        print(f"{_DIM}  Video & Audio Processing Pipeline v1.0.0{_RESET}")
-        print(f"{_CYAN}" + "=" * 70 + _RESET)
-
-        # System info line
-        has_token = bool(self.config.get('hf_token') or os.getenv('HF_TOKEN'))
-        token_status = f"{_GREEN}OK{_RESET}" if has_token else f"{_RED}not set{_RESET}"
-        device = self.config.get('device', 'auto')
-        lang = self.config.get('language', 'en')
-        print(f"  {_DIM}OS:{_RESET} {platform.system()} {platform.machine()}"
-              f"  {_DIM}Lang:{_RESET} {lang}"
-              f"  {_DIM}Device:{_RESET} {device}"
-              f"  {_DIM}HF Token:{_RESET} {token_status}")
+        _write_static(_HEADER_STR, _HEADER_BYTES, self._sysinfo_line())
 
     def print_menu(self):
         """Print main menu."""
-        W = 66  # inner width
-        print()
-        print(f"  {_BOLD}┌─ Main Menu ─" + "─" * (W - 14) + f"┐{_RESET}")
-        items = [
-            ("1", "Process single video file",  ""),
-            ("2", "Process single audio file",   ""),
-            ("3", "Batch process multiple files", ""),
-            ("4", "Quick process (drag & drop)",  f"{_GREEN}NEW{_RESET}"),
-            ("5", "View processing history",      ""),
-            ("6", "Configure settings",           ""),
-            ("7", "Show current configuration",   ""),
-            ("8", "Help & Documentation",         ""),
-            ("0", "Exit",                         ""),
-        ]
-        for num, label, badge in items:
-            badge_text = f" [{badge}]" if badge else ""
-            # Calculate visible length (without ANSI codes)
-            visible_len = len(f"  {num}. {label}") + (len(badge_text) - (len(badge) - len(badge.replace('\033', ''))) if badge else 0)
-            # Just pad with spaces to roughly align
-            line = f"  {_BOLD}{num}.{_RESET} {label}{badge_text}"
-            print(f"  │{line:<{W + 20}}│")
-        print(f"  {_BOLD}└" + "─" * W + f"┘{_RESET}")
+        _write_static(_MENU_STR, _MENU_BYTES)
+
+    def _render_frame(self, prompt: str, clear: bool = True) -> str:
+        """
+        Build the full main screen (clear, header, menu and prompt).
+
+        Args:
+            prompt: Formatted input prompt placed after the menu
+            clear: Prefix the frame with the ANSI clear sequence
+
+        Returns:
+            Frame text ready for a single write
+        """
+        return ((_CLEAR if clear else "") + _HEADER_STR + self._sysinfo_line()
+                + _MENU_STR + prompt)
 
     def get_input(self, prompt: str, default: str = None) -> str:
         """
@@ -115,12 +436,25 @@ class InteractiveConsole:
         Returns:
             User input or default
         """
-        if default:
-            full_prompt = f"{prompt} [{default}]: "
-        else:
-            full_prompt = f"{prompt}: "
+        sys.stdout.write(self._format_prompt(prompt, default))
+        sys.stdout.flush()
+        return self._read_input(default)
 
-        value = input(full_prompt).strip()
+    @staticmethod
+    def _format_prompt(prompt: str, default: str = None) -> str:
+        """Format an input prompt, showing the default value if any."""
+        if default:
+            return f"{prompt} [{default}]: "
+        return f"{prompt}: "
+
+    @staticmethod
+    def _read_input(default: str = None) -> str:
+        """Read one line from stdin, returning the default when empty."""
+        # Plain readline avoids GNU readline's per-prompt setup cost
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        value = line.strip()
         return value if value else default
 
     def get_yes_no(self, prompt: str, default: bool = False) -> bool:
@@ -137,7 +471,7 @@ class InteractiveConsole:
         default_str = "Y/n" if default else "y/N"
         response = self.get_input(f"{prompt} ({default_str})",
                                   "y" if default else "n").lower()
-        return response in ['y', 'yes', 'да', 'д']
+        return response in _YES
 
     def browse_files(self, file_type: str = "video") -> Optional[str]:
         """
@@ -149,47 +483,74 @@ class InteractiveConsole:
         Returns:
             Selected file path or None
         """
-        if file_type == "video":
-            extensions = ['.mp4', '.m4v', '.avi', '.mkv', '.mov', '.webm', '.wmv', '.flv', '.mpg', '.mpeg']
-        else:
-            extensions = ['.wav', '.mp3', '.flac', '.ogg', '.m4a', '.wma', '.aac', '.opus']
+        suffixes = _VIDEO_SUFFIXES if file_type == "video" else _AUDIO_SUFFIXES
 
         print(f"\n📁 Browsing for {file_type} files...")
 
         # Check input directory
         input_dir = Path("./input")
         if input_dir.exists():
-            files = []
-            for ext in extensions:
-                files.extend(input_dir.glob(f"*{ext}"))
+            entries = _scan_media(input_dir, suffixes)
+            files = [path for path, _ in entries]
 
             if files:
                 print(f"\nFound {len(files)} file(s) in ./input directory:")
-                for idx, file in enumerate(files, 1):
-                    file_size = file.stat().st_size / (1024 * 1024)  # MB
-                    print(f"  {idx}. {file.name} ({file_size:.2f} MB)")
+                _print_file_list(entries)
 
                 choice = self.get_input("\nSelect file number or enter custom path", "1")
 
-                try:
-                    if choice.isdigit() and 1 <= int(choice) <= len(files):
-                        return str(files[int(choice) - 1])
-                except ValueError:
-                    pass
+                n = _parse_choice(choice, 1, len(files))
+                if n is not None:
+                    return os.fspath(files[n - 1])
 
                 # Custom path
-                if choice and Path(choice).exists():
+                if choice and os.path.isfile(choice):
                     return choice
 
         # Manual path entry
         path = self.get_input(f"\nEnter {file_type} file path")
-        if path and Path(path).exists():
+        if path and os.path.isfile(path):
             return path
         elif path:
             print(f"❌ Error: File not found: {path}")
 
         return None
 
+    def _history_log_path(self) -> Path:
+        """Path of the persistent JSONL history log in the output directory."""
+        return Path(self.config['output']['directory']) / _HISTORY_LOG_NAME
+
+    def _append_history(self, entry: Dict[str, Any]):
+        """
+        Record a processing run in the session history and the JSONL log.
+
+        The log line is appended immediately, so runs survive a crash or an
+        interrupted session without rewriting earlier entries.
+
+        Args:
+            entry: History entry
+        """
+        import json
+
+        self.history.append(entry)
+        log_path = self._history_log_path()
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not append to history log {log_path}: {e}")
+
+    def _hf_token(self) -> Optional[str]:
+        """Return the configured HuggingFace token, falling back to HF_TOKEN."""
+        return self.config['hf_token'] or self._env_hf_token
+
+    def _report_missing_token(self):
+        """Tell the user that processing needs a HuggingFace token."""
+        print("\n❌ Error: HuggingFace token not configured!")
+        print("Please set HF_TOKEN environment variable or configure in settings.")
+        input("\nPress Enter to continue...")
+
     def _ensure_pipeline(self, language: str) -> bool:
         """
         Ensure the pipeline is initialized. Creates it if needed.
@@ -203,22 +564,17 @@ class InteractiveConsole:
         if self.pipeline:
             return True
 
-        from .pipeline import VideoPipeline
-        hf_token = self.config.get('hf_token') or os.getenv('HF_TOKEN')
+        hf_token = self._hf_token()
         if not hf_token:
-            print("\n❌ Error: HuggingFace token not configured!")
-            print("Please set HF_TOKEN environment variable or configure in settings.")
-            input("\nPress Enter to continue...")
+            self._report_missing_token()
             return False
 
-        print("\n⏳ Initializing pipeline...")
+        VideoPipeline = _pipeline_cls()
+
+        print("\n⏳ Initializing pipeline...", flush=True)
         try:
             self.pipeline = VideoPipeline(
-                language=language,
-                model_variant=self.config.get('model_variant', 'default'),
-                hf_token=hf_token,
-                device=self.config.get('device', 'auto'),
-                output_dir=self.config.get('output', {}).get('directory', './output')
+                **pipeline_kwargs(self.config, language=language, hf_token=hf_token)
             )
             return True
         except Exception as e:
@@ -237,10 +593,10 @@ class InteractiveConsole:
         print("\n⚙️  Processing Options:")
 
         language = self.get_input("Language (en/ru/zh)",
-                                  self.config.get('language', 'en'))
+                                  self.config['language'])
 
         num_speakers_str = self.get_input("Number of speakers (leave empty for auto-detection)", "")
-        num_speakers = int(num_speakers_str) if num_speakers_str and num_speakers_str.isdigit() else None
+        num_speakers = _parse_choice(num_speakers_str)
 
         extract_keywords = self.get_yes_no("Extract keywords?", True)
 
@@ -249,47 +605,106 @@ class InteractiveConsole:
         if extract_keywords:
             keyword_method = self.get_input("Keyword method (tfidf/textrank)", "tfidf")
             top_keywords_str = self.get_input("Number of top keywords", "10")
-            top_keywords = int(top_keywords_str) if top_keywords_str.isdigit() else 10
+            top_keywords = _parse_choice(top_keywords_str)
+            if top_keywords is None:
+                top_keywords = 10
 
         print("\nOutput formats: json, txt, csv, plain")
         formats_input = self.get_input("Select formats (comma-separated)", "json,txt")
-        save_formats = [f.strip() for f in formats_input.split(',')]
+        save_formats = self._parse_formats(formats_input)
 
         return language, num_speakers, extract_keywords, keyword_method, top_keywords, save_formats
 
+    def _parse_formats(self, formats_input: str, default=('json', 'txt')) -> List[str]:
+        """
+        Parse a comma-separated list of output formats.
+
+        Unknown entries are dropped so a typo does not surface only after the
+        pipeline has finished.
+
+        Args:
+            formats_input: User input such as "json, TXT,csv"
+            default: Formats to use when nothing valid was entered
+
+        Returns:
+            List of valid format names
+        """
+        parts = [p for p in (x.strip().lower() for x in formats_input.split(','))
+                 if p in _VALID_FORMATS]
+        return parts or list(default)
+
     def _print_processing_summary(self, file_path, language, num_speakers,
                                   extract_keywords, keyword_method, top_keywords,
                                   save_formats):
         """Print a summary of the processing options before starting."""
-        print("\n" + "─" * 70)
-        print("📋 Processing Summary:")
-        print(f"  File: {file_path}")
-        print(f"  Language: {language}")
-        print(f"  Speakers: {num_speakers or 'auto-detect'}")
-        print(f"  Keywords: {extract_keywords}")
+        lines = [
+            "",
+            _HR,
+            "📋 Processing Summary:",
+            f"  File: {file_path}",
+            f"  Language: {language}",
+            f"  Speakers: {num_speakers or 'auto-detect'}",
+            f"  Keywords: {extract_keywords}",
+        ]
         if extract_keywords:
-            print(f"  Keyword method: {keyword_method}")
-            print(f"  Top keywords: {top_keywords}")
-        print(f"  Output formats: {', '.join(save_formats)}")
-        print("─" * 70)
-
-    def _print_results(self, results, extract_keywords):
-        """Print processing results."""
-        print("\n" + "=" * 70)
-        print("✅ PROCESSING COMPLETED SUCCESSFULLY")
-        print("=" * 70)
-        print(f"⏱️  Total time: {results['total_processing_time']:.2f} seconds")
-        print(f"📝 Segments: {results['steps'].get('transcription', {}).get('num_segments', 0)}")
-        print(f"👥 Speakers: {results['steps'].get('diarization', {}).get('num_speakers', 0)}")
-
+            lines.append(f"  Keyword method: {keyword_method}")
+            lines.append(f"  Top keywords: {top_keywords}")
+        lines.append(f"  Output formats: {', '.join(save_formats)}")
+        lines.append(_HR)
+        self._emit(lines)
+
+    def _report_completed(self, file_type: str, file_path: str, language: str,
+                          results: Dict[str, Any], extract_keywords: bool):
+        """Print processing results and record the run in the history."""
+        steps = results.get('steps', {})
+        num_segments = steps.get('transcription', {}).get('num_segments', 0)
+        num_speakers = steps.get('diarization', {}).get('num_speakers', 0)
+        total_time = results['total_processing_time']
+        output_files = results.get('output_files', {})
+
+        lines = [
+            "",
+            _RULE,
+            "✅ PROCESSING COMPLETED SUCCESSFULLY",
+            _RULE,
+            f"⏱️  Total time: {total_time:.2f} seconds",
+            f"📝 Segments: {num_segments}",
+            f"👥 Speakers: {num_speakers}",
+        ]
         if extract_keywords:
-            print(f"🔑 Keywords: {len(results.get('keywords', []))}")
+            lines.append(f"🔑 Keywords: {len(results.get('keywords', ()))}")
+        lines.append("\n📄 Output files:")
+        lines.extend(f"  • {format_type.upper()}: {path}"
+                     for format_type, path in output_files.items())
+        lines.append(_RULE)
+        self._emit(lines)
+
+        self._append_history({
+            'timestamp': _now_iso(),
+            'type': file_type,
+            'file': file_path,
+            'file_name': os.path.basename(file_path),
+            'language': language,
+            'status': 'completed',
+            'processing_time': total_time,
+            'output_files': output_files
+        })
+
+    def _process_one(self, file_type: str, file_path: str, **options) -> Dict[str, Any]:
+        """
+        Run the pipeline entry point matching the file type.
 
-        print("\n📄 Output files:")
-        for format_type, file_path in results.get('output_files', {}).items():
-            print(f"  • {format_type.upper()}: {file_path}")
+        Args:
+            file_type: 'video' or 'audio'
+            file_path: Path to the input file
+            **options: Keyword arguments forwarded to the pipeline
 
-        print("=" * 70)
+        Returns:
+            Processing results dictionary
+        """
+        if file_type == "video":
+            return self.pipeline.process_video(file_path, **options)
+        return self.pipeline.process_audio(file_path, **options)
 
     def _process_single_file(self, file_type: str):
         """
@@ -299,9 +714,7 @@ class InteractiveConsole:
             file_type: 'video' or 'audio'
         """
         label = "📹 Process Single Video File" if file_type == "video" else "🎵 Process Single Audio File"
-        print("\n" + "─" * 70)
-        print(label)
-        print("─" * 70)
+        self._emit(["", _HR, label, _HR])
 
         # Get file path
         file_path = self.browse_files(file_type)
@@ -330,51 +743,37 @@ class InteractiveConsole:
 
         # Process file
         print(f"\n🚀 Starting {file_type} processing...")
-        print("This may take a while depending on file size and hardware.\n")
+        print("This may take a while depending on file size and hardware.\n", flush=True)
 
         try:
-            if file_type == "video":
-                results = self.pipeline.process_video(
-                    video_path=file_path,
-                    num_speakers=num_speakers,
-                    extract_keywords=extract_keywords,
-                    keyword_method=keyword_method,
-                    top_keywords=top_keywords,
-                    save_formats=save_formats
-                )
-            else:
-                results = self.pipeline.process_audio(
-                    audio_path=file_path,
-                    num_speakers=num_speakers,
-                    extract_keywords=extract_keywords,
-                    keyword_method=keyword_method,
-                    top_keywords=top_keywords,
-                    save_formats=save_formats
-                )
-
-            self._print_results(results, extract_keywords)
-
-            self.history.append({
-                'timestamp': datetime.now().isoformat(),
-                'type': file_type,
-                'file': file_path,
-                'language': language,
-                'status': 'completed',
-                'processing_time': results['total_processing_time'],
-                'output_files': results.get('output_files', {})
-            })
+            results = self._process_one(
+                file_type,
+                file_path,
+                num_speakers=num_speakers,
+                extract_keywords=extract_keywords,
+                keyword_method=keyword_method,
+                top_keywords=top_keywords,
+                save_formats=save_formats
+            )
+
+            self._report_completed(file_type, file_path, language, results,
+                                   extract_keywords)
 
         except Exception as e:
-            print("\n" + "=" * 70)
-            print("❌ PROCESSING FAILED")
-            print("=" * 70)
-            print(f"Error: {e}")
-            print("=" * 70)
-
-            self.history.append({
-                'timestamp': datetime.now().isoformat(),
+            self._emit([
+                "",
+                _RULE,
+                "❌ PROCESSING FAILED",
+                _RULE,
+                f"Error: {e}",
+                _RULE,
+            ])
+
+            self._append_history({
+                'timestamp': _now_iso(),
                 'type': file_type,
                 'file': file_path,
+                'file_name': os.path.basename(file_path),
                 'language': language,
                 'status': 'failed',
                 'error': str(e)
@@ -392,29 +791,28 @@ class InteractiveConsole:
 
     def batch_process(self):
         """Batch process multiple files."""
-        print("\n" + "─" * 70)
-        print("📦 Batch Process Multiple Files")
-        print("─" * 70)
+        self._emit(["", _HR, "📦 Batch Process Multiple Files", _HR])
 
         print("\nThis feature allows you to process multiple video/audio files.")
         print("All files will be processed with the same settings.")
 
+        # Fail fast: without a token the pipeline cannot be built for any file
+        if not self.pipeline and not self._hf_token():
+            self._report_missing_token()
+            return
+
         # Get directory
         directory = self.get_input("\nEnter directory path", "./input")
         dir_path = Path(directory)
 
-        if not dir_path.exists():
+        if not dir_path.is_dir():
             print(f"❌ Error: Directory not found: {directory}")
             input("\nPress Enter to continue...")
             return
 
         # Find files
-        video_extensions = ['.mp4', '.m4v', '.avi', '.mkv', '.mov', '.webm', '.wmv', '.flv', '.mpg', '.mpeg']
-        audio_extensions = ['.wav', '.mp3', '.flac', '.ogg', '.m4a', '.wma', '.aac', '.opus']
-
-        all_files = []
-        for ext in video_extensions + audio_extensions:
-            all_files.extend(dir_path.glob(f"*{ext}"))
+        entries = _scan_media(dir_path, _MEDIA_SUFFIXES)
+        all_files = [path for path, _ in entries]
 
         if not all_files:
             print(f"❌ No video or audio files found in: {directory}")
@@ -422,9 +820,7 @@ class InteractiveConsole:
             return
 
         print(f"\n✅ Found {len(all_files)} file(s):")
-        for idx, file in enumerate(all_files, 1):
-            file_size = file.stat().st_size / (1024 * 1024)
-            print(f"  {idx}. {file.name} ({file_size:.2f} MB)")
+        _print_file_list(entries)
 
         if not self.get_yes_no(f"\nProcess all {len(all_files)} files?", True):
             print("❌ Batch processing cancelled.")
@@ -434,7 +830,7 @@ class InteractiveConsole:
         # Get common settings
         print("\n⚙️  Common Processing Settings:")
         language = self.get_input("Language (en/ru/zh)",
-                                  self.config.get('language', 'en'))
+                                  self.config['language'])
         extract_keywords = self.get_yes_no("Extract keywords?", True)
 
         keyword_method = "tfidf"
@@ -442,111 +838,198 @@ class InteractiveConsole:
             keyword_method = self.get_input("Keyword method (tfidf/textrank)", "tfidf")
 
         formats_input = self.get_input("Output formats (comma-separated, options: json,txt,csv,plain)", "json,txt")
-        save_formats = [f.strip() for f in formats_input.split(',')]
-
-        # Initialize pipeline if needed
-        if not self._ensure_pipeline(language):
+        save_formats = self._parse_formats(formats_input)
+
+        total = len(all_files)
+        jobs = [(str(path), _EXT_KIND.get(path.suffix.lower(), "audio"))
+                for path in all_files]
+        options = {
+            'extract_keywords': extract_keywords,
+            'keyword_method': keyword_method,
+            'save_formats': save_formats,
+        }
+        workers = self._batch_workers(total)
+
+        # Initialize pipeline if needed (worker processes build their own)
+        if workers == 1 and not self._ensure_pipeline(language):
             return
 
         # Process files
-        print(f"\n🚀 Starting batch processing of {len(all_files)} files...")
+        print(f"\n🚀 Starting batch processing of {total} files...", flush=True)
 
         successful = 0
         failed = 0
 
-        for idx, file_path in enumerate(all_files, 1):
-            print(f"\n[{idx}/{len(all_files)}] Processing: {file_path.name}")
-
-            is_video = file_path.suffix.lower() in video_extensions
-
-            try:
-                if is_video:
-                    results = self.pipeline.process_video(
-                        video_path=str(file_path),
-                        extract_keywords=extract_keywords,
-                        keyword_method=keyword_method,
-                        save_formats=save_formats
-                    )
+        # Progress and per-file results go through a background writer
+        # (_DeferredWriter) so the processing loop never blocks on the terminal
+        if workers > 1:
+            print(f"Using {workers} worker processes (device: cpu)", flush=True)
+            worker_kwargs = pipeline_kwargs(self.config, language=language,
+                                            hf_token=self._hf_token(), device='cpu')
+            num_threads = max(1, (os.cpu_count() or 1) // workers)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_batch_worker,
+                                     initargs=(worker_kwargs, num_threads)) as pool:
+                # Submit (and so start the workers) before the writer thread exists
+                futures = {
+                    pool.submit(_process_batch_file, file_type, file_str, options): (file_str, file_type)
+                    for file_str, file_type in jobs
+                }
+                with _DeferredWriter() as out:
+                    for idx, future in enumerate(as_completed(futures), 1):
+                        file_str, file_type = futures[future]
+                        out.put(f"\n[{idx}/{total}] Finished: {os.path.basename(file_str)}\n")
+                        try:
+                            ok = self._record_batch_result(file_type, file_str, language,
+                                                           processing_time=future.result(), out=out)
+                        except Exception as e:
+                            ok = self._record_batch_result(file_type, file_str, language,
+                                                           error=e, out=out)
+                        successful += ok
+                        failed += not ok
+        else:
+            # The pipeline extracts and decodes the next file in the
+            # background while the current one runs through the models
+            file_types = dict(jobs)
+            started = 0
+
+            def announce(file_str: str):
+                nonlocal started
+                started += 1
+                out.put(f"\n[{started}/{total}] Processing: {os.path.basename(file_str)}\n")
+
+            def report(file_str: str, results: Dict[str, Any]):
+                nonlocal successful, failed
+                file_type = file_types[file_str]
+                if results.get('status') == 'failed':
+                    ok = self._record_batch_result(file_type, file_str, language,
+                                                   error=results['error'], out=out)
                 else:
-                    results = self.pipeline.process_audio(
-                        audio_path=str(file_path),
-                        extract_keywords=extract_keywords,
-                        keyword_method=keyword_method,
-                        save_formats=save_formats
-                    )
-
-                print(f"✅ Completed in {results['total_processing_time']:.2f}s")
-                successful += 1
-
-                self.history.append({
-                    'timestamp': datetime.now().isoformat(),
-                    'type': 'video' if is_video else 'audio',
-                    'file': str(file_path),
-                    'language': language,
-                    'status': 'completed',
-                    'processing_time': results['total_processing_time'],
-                    'batch': True
-                })
+                    ok = self._record_batch_result(file_type, file_str, language,
+                                                   processing_time=results['total_processing_time'],
+                                                   out=out)
+                successful += ok
+                failed += not ok
 
-            except Exception as e:
-                print(f"❌ Failed: {e}")
-                failed += 1
-
-                self.history.append({
-                    'timestamp': datetime.now().isoformat(),
-                    'type': 'video' if is_video else 'audio',
-                    'file': str(file_path),
-                    'language': language,
-                    'status': 'failed',
-                    'error': str(e),
-                    'batch': True
-                })
+            with _DeferredWriter() as out:
+                self.pipeline.process_batch([file_str for file_str, _ in jobs],
+                                            on_start=announce, on_result=report, **options)
 
         # Summary
-        print("\n" + "=" * 70)
-        print("📊 BATCH PROCESSING SUMMARY")
-        print("=" * 70)
-        print(f"✅ Successful: {successful}/{len(all_files)}")
-        print(f"❌ Failed: {failed}/{len(all_files)}")
-        print("=" * 70)
+        self._emit([
+            "",
+            _RULE,
+            "📊 BATCH PROCESSING SUMMARY",
+            _RULE,
+            f"✅ Successful: {successful}/{total}",
+            f"❌ Failed: {failed}/{total}",
+            _RULE,
+        ])
 
         input("\nPress Enter to continue...")
 
+    def _batch_workers(self, total: int) -> int:
+        """
+        Number of worker processes to use for a batch.
+
+        Only CPU batches run in parallel; a GPU is already saturated by a
+        single pipeline.
+
+        Args:
+            total: Number of files in the batch
+
+        Returns:
+            Worker count (1 means process serially in this process)
+        """
+        if self.config['device'] != 'cpu' or total < 2:
+            return 1
+        return max(1, min(self.config['batch_workers'], os.cpu_count() or 1, total))
+
+    def _record_batch_result(self, file_type: str, file_path: str, language: str,
+                             processing_time: Optional[float] = None,
+                             error: Optional[Union[Exception, str]] = None,
+                             out: Optional['_DeferredWriter'] = None) -> bool:
+        """
+        Report one batch file's outcome and add it to the history.
+
+        Args:
+            out: Deferred writer for the report line (printed directly if None)
+
+        Returns:
+            True if the file was processed successfully
+        """
+        entry = {
+            'timestamp': _now_iso(),
+            'type': file_type,
+            'file': file_path,
+            'file_name': os.path.basename(file_path),
+            'language': language,
+        }
+        if error is None:
+            report = lambda: f"✅ Completed in {processing_time:.2f}s\n"
+            entry['status'] = 'completed'
+            entry['processing_time'] = processing_time
+        else:
+            report = lambda: f"❌ Failed: {error}\n"
+            entry['status'] = 'failed'
+            entry['error'] = str(error)
+        entry['batch'] = True
+        self._append_history(entry)
+
+        if out is not None:
+            out.put(report)
+        else:
+            sys.stdout.write(report())
+        return error is None
+
     def view_history(self):
         """View processing history."""
-        print("\n" + "─" * 70)
-        print("📜 Processing History")
-        print("─" * 70)
+        self._emit(["", _HR, "📜 Processing History", _HR])
 
         if not self.history:
             print("\nNo processing history available.")
             input("\nPress Enter to continue...")
             return
 
-        print(f"\nTotal entries: {len(self.history)}")
-        print("\nRecent entries (newest first):")
-
-        for idx, entry in enumerate(reversed(self.history[-10:]), 1):
-            status_icon = "✅" if entry['status'] == 'completed' else "❌"
-            print(f"\n{idx}. {status_icon} {entry['type'].upper()}")
-            print(f"   Time: {entry['timestamp']}")
-            print(f"   File: {Path(entry['file']).name}")
-            print(f"   Language: {entry['language']}")
-
-            if entry['status'] == 'completed':
-                print(f"   Duration: {entry.get('processing_time', 0):.2f}s")
+        lines = [
+            "",
+            f"Total entries: {len(self.history)}",
+            f"Full log: {self._history_log_path()}",
+            "",
+            "Recent entries (newest first):",
+        ]
+        for idx, entry in enumerate(islice(reversed(self.history), 10), 1):
+            completed = entry['status'] == 'completed'
+            status_icon = "✅" if completed else "❌"
+            lines.append("")
+            lines.append(f"{idx}. {status_icon} {entry['type'].upper()}")
+            lines.append(f"   Time: {entry['timestamp']}")
+            # Older log records have no precomputed file_name
+            name = entry.get('file_name') or os.path.basename(entry['file'])
+            lines.append(f"   File: {name}")
+            lines.append(f"   Language: {entry['language']}")
+
+            if completed:
+                lines.append(f"   Duration: {entry.get('processing_time', 0):.2f}s")
                 if 'output_files' in entry:
-                    print(f"   Outputs: {len(entry['output_files'])} file(s)")
+                    lines.append(f"   Outputs: {len(entry['output_files'])} file(s)")
             else:
-                print(f"   Error: {entry.get('error', 'Unknown')}")
+                lines.append(f"   Error: {entry.get('error', 'Unknown')}")
+        self._emit(lines)
 
         # Export option
         if self.get_yes_no("\nExport history to JSON?", False):
-            history_file = Path("./output/processing_history.json")
-            history_file.parent.mkdir(exist_ok=True)
+            history_file = Path(self.config['output']['directory']) / _HISTORY_EXPORT_NAME
+            history_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            # Serialize up front so the file is written in a single call
+            if _HAS_ORJSON:
+                payload = orjson.dumps(list(self.history), option=orjson.OPT_INDENT_2)
+            else:
+                import json
+                payload = json.dumps(list(self.history), ensure_ascii=False,
+                                     separators=(',', ':')).encode('utf-8')
+            history_file.write_bytes(payload)
 
             print(f"✅ History exported to: {history_file}")
 
@@ -554,15 +1037,13 @@ class InteractiveConsole:
 
     def configure_settings(self):
         """Configure application settings."""
-        print("\n" + "─" * 70)
-        print("⚙️  Configure Settings")
-        print("─" * 70)
+        self._emit(["", _HR, "⚙️  Configure Settings", _HR])
 
         print("\nCurrent settings:")
-        print(f"  Language: {self.config.get('language', 'en')}")
-        print(f"  Model variant: {self.config.get('model_variant', 'default')}")
-        print(f"  Device: {self.config.get('device', 'auto')}")
-        print(f"  Output directory: {self.config.get('output', {}).get('directory', './output')}")
+        print(f"  Language: {self.config['language']}")
+        print(f"  Model variant: {self.config['model_variant']}")
+        print(f"  Device: {self.config['device']}")
+        print(f"  Output directory: {self.config['output']['directory']}")
 
         if not self.get_yes_no("\nModify settings?", False):
             input("\nPress Enter to continue...")
@@ -573,32 +1054,30 @@ class InteractiveConsole:
 
         new_language = self.get_input(
             "Language (en/ru/zh)",
-            self.config.get('language', 'en')
+            self.config['language']
         )
         if new_language:
             self.config['language'] = new_language
 
         new_model = self.get_input(
             "Model variant",
-            self.config.get('model_variant', 'default')
+            self.config['model_variant']
         )
         if new_model:
             self.config['model_variant'] = new_model
 
         new_device = self.get_input(
             "Device (auto/cuda/cpu)",
-            self.config.get('device', 'auto')
+            self.config['device']
         )
         if new_device:
             self.config['device'] = new_device
 
         new_output = self.get_input(
             "Output directory",
-            self.config.get('output', {}).get('directory', './output')
+            self.config['output']['directory']
         )
         if new_output:
-            if 'output' not in self.config:
-                self.config['output'] = {}
             self.config['output']['directory'] = new_output
 
         # HuggingFace token
@@ -617,52 +1096,57 @@ class InteractiveConsole:
 
     def show_configuration(self):
         """Display current configuration."""
-        print("\n" + "─" * 70)
-        print("📋 Current Configuration")
-        print("─" * 70)
-
-        print("\n🌍 Language Settings:")
-        print(f"  Language: {self.config.get('language', 'en')}")
-        print(f"  Model variant: {self.config.get('model_variant', 'default')}")
-
-        print("\n💻 Device Settings:")
-        print(f"  Device: {self.config.get('device', 'auto')}")
-
-        print("\n📁 Output Settings:")
-        output_cfg = self.config.get('output', {})
-        print(f"  Directory: {output_cfg.get('directory', './output')}")
-        print(f"  Formats: {', '.join(output_cfg.get('formats', ['json', 'txt']))}")
-
-        print("\n🔑 Keyword Extraction:")
-        keywords_cfg = self.config.get('keywords', {})
-        print(f"  Enabled: {keywords_cfg.get('enabled', True)}")
-        print(f"  Method: {keywords_cfg.get('method', 'tfidf')}")
-        print(f"  Top N: {keywords_cfg.get('top_n', 10)}")
-
-        print("\n🔧 Post-processing:")
-        postproc_cfg = self.config.get('postprocessing', {})
-        print(f"  Remove fillers: {postproc_cfg.get('remove_fillers', True)}")
-        print(f"  Remove profanity: {postproc_cfg.get('remove_profanity', True)}")
-
-        print("\n🎵 Audio Settings:")
-        audio_cfg = self.config.get('audio', {})
-        print(f"  Sample rate: {audio_cfg.get('sample_rate', 16000)} Hz")
-        print(f"  Channels: {audio_cfg.get('channels', 1)}")
-
-        print("\n🔐 Authentication:")
-        has_token = bool(self.config.get('hf_token') or os.getenv('HF_TOKEN'))
-        print(f"  HuggingFace token: {'✅ Configured' if has_token else '❌ Not configured'}")
+        cfg = self.config
+        output_cfg = cfg['output']
+        keywords_cfg = cfg['keywords']
+        postproc_cfg = cfg['postprocessing']
+        audio_cfg = cfg['audio']
+        has_token = bool(self._hf_token())
+
+        self._emit([
+            "",
+            _HR,
+            "📋 Current Configuration",
+            _HR,
+            "",
+            "🌍 Language Settings:",
+            f"  Language: {cfg['language']}",
+            f"  Model variant: {cfg['model_variant']}",
+            "",
+            "💻 Device Settings:",
+            f"  Device: {cfg['device']}",
+            "",
+            "📁 Output Settings:",
+            f"  Directory: {output_cfg['directory']}",
+            f"  Formats: {', '.join(output_cfg['formats'])}",
+            "",
+            "🔑 Keyword Extraction:",
+            f"  Enabled: {keywords_cfg['enabled']}",
+            f"  Method: {keywords_cfg['method']}",
+            f"  Top N: {keywords_cfg['top_n']}",
+            "",
+            "🔧 Post-processing:",
+            f"  Remove fillers: {postproc_cfg['remove_fillers']}",
+            f"  Remove profanity: {postproc_cfg['remove_profanity']}",
+            "",
+            "🎵 Audio Settings:",
+            f"  Sample rate: {audio_cfg['sample_rate']} Hz",
+            f"  Channels: {audio_cfg['channels']}",
+            "",
+            "🔐 Authentication:",
+            f"  HuggingFace token: {'✅ Configured' if has_token else '❌ Not configured'}",
+        ])
 
         input("\nPress Enter to continue...")
 
     def quick_process(self):
         """Quick process — enter a file path and go with sensible defaults."""
-        print(f"\n{_BOLD}Quick Process{_RESET}")
+        print(_FMT['quick_title'])
         print("Enter the path to a video or audio file (or drag & drop it here).\n")
 
         path_input = self.get_input("File path")
         if not path_input:
-            print(f"{_RED}No path provided.{_RESET}")
+            print(_FMT['error'].format("No path provided."))
             input("\nPress Enter to continue...")
             return
 
@@ -671,23 +1155,18 @@ class InteractiveConsole:
         file_path = Path(path_input)
 
         if not file_path.exists():
-            print(f"{_RED}File not found: {file_path}{_RESET}")
+            print(_FMT['error'].format(f"File not found: {file_path}"))
             input("\nPress Enter to continue...")
             return
 
-        video_exts = {'.mp4', '.m4v', '.avi', '.mkv', '.mov', '.webm', '.wmv', '.flv', '.mpg', '.mpeg'}
-        audio_exts = {'.wav', '.mp3', '.flac', '.ogg', '.m4a', '.wma', '.aac', '.opus'}
         ext = file_path.suffix.lower()
 
-        if ext in video_exts:
-            file_type = "video"
-        elif ext in audio_exts:
-            file_type = "audio"
-        else:
-            print(f"{_YELLOW}Unknown extension '{ext}'. Trying as video...{_RESET}")
+        file_type = _EXT_KIND.get(ext)
+        if file_type is None:
+            print(_FMT['warning'].format(f"Unknown extension '{ext}'. Trying as video..."))
             file_type = "video"
 
-        language = self.config.get('language', 'en')
+        language = self.config['language']
         print(f"\n  File:     {file_path.name} ({file_path.stat().st_size / 1048576:.1f} MB)")
         print(f"  Type:     {file_type}")
         print(f"  Language: {language}")
@@ -699,73 +1178,59 @@ class InteractiveConsole:
         if not self._ensure_pipeline(language):
             return
 
-        print(f"\n{_CYAN}Processing...{_RESET}\n")
+        print(_FMT['processing'], flush=True)
 
         try:
-            if file_type == "video":
-                results = self.pipeline.process_video(
-                    video_path=str(file_path),
-                    save_formats=["json", "txt"]
-                )
-            else:
-                results = self.pipeline.process_audio(
-                    audio_path=str(file_path),
-                    save_formats=["json", "txt"]
-                )
-            self._print_results(results, extract_keywords=True)
-
-            self.history.append({
-                'timestamp': datetime.now().isoformat(),
-                'type': file_type,
-                'file': str(file_path),
-                'language': language,
-                'status': 'completed',
-                'processing_time': results['total_processing_time'],
-                'output_files': results.get('output_files', {})
-            })
+            results = self._process_one(file_type, str(file_path),
+                                        save_formats=["json", "txt"])
+            self._report_completed(file_type, str(file_path), language, results,
+                                   extract_keywords=True)
         except Exception as e:
-            print(f"\n{_RED}Processing failed: {e}{_RESET}")
+            print("\n" + _FMT['error'].format(f"Processing failed: {e}"))
 
         input("\nPress Enter to continue...")
 
     def show_help(self):
         """Display help and documentation."""
-        print("\n" + "─" * 70)
-        print("📚 Help & Documentation")
-        print("─" * 70)
-
-        print("\n🎯 Quick Start:")
-        print("  1. Place your video/audio files in the ./input directory")
-        print("  2. Select option 1 or 2 from the main menu")
-        print("  3. Follow the prompts to configure processing")
-        print("  4. Results will be saved in the ./output directory")
-
-        print("\n📖 Supported Formats:")
-        print("  Video: MP4, AVI, MKV, MOV, WebM")
-        print("  Audio: WAV, MP3, FLAC, OGG, M4A")
-
-        print("\n🌍 Supported Languages:")
-        print("  en - English (WhisperX, Whisper large-v3)")
-        print("  ru - Russian (bond005/whisper-podlodka-turbo)")
-        print("  zh - Chinese (Whisper large-v3)")
-
-        print("\n⚙️  Processing Options:")
-        print("  • Number of speakers: Auto-detect or specify (2, 3, etc.)")
-        print("  • Keyword extraction: TF-IDF or TextRank methods")
-        print("  • Output formats: JSON (detailed), TXT (readable), CSV (tabular), Plain (text only)")
-        print("    - Plain format: Pure text without timestamps or speaker labels")
-
-        print("\n💡 Tips:")
-        print("  • For best results, use clean audio with minimal background noise")
-        print("  • Specify number of speakers if known for better diarization")
-        print("  • Use GPU (CUDA) for faster processing of large files")
-        print("  • Check processing history to track your work")
-
-        print("\n🔗 Resources:")
-        print("  • README.md - Full documentation")
-        print("  • QUICKSTART.md - Quick start guide")
-        print("  • MODELS.md - Model comparison and benchmarks")
-        print("  • GitHub: https://github.com/llcarn8n/LLCAR")
+        self._emit([
+            "",
+            _HR,
+            "📚 Help & Documentation",
+            _HR,
+            "",
+            "🎯 Quick Start:",
+            "  1. Place your video/audio files in the ./input directory",
+            "  2. Select option 1 or 2 from the main menu",
+            "  3. Follow the prompts to configure processing",
+            "  4. Results will be saved in the ./output directory",
+            "",
+            "📖 Supported Formats:",
+            "  Video: MP4, AVI, MKV, MOV, WebM",
+            "  Audio: WAV, MP3, FLAC, OGG, M4A",
+            "",
+            "🌍 Supported Languages:",
+            "  en - English (WhisperX, Whisper large-v3)",
+            "  ru - Russian (bond005/whisper-podlodka-turbo)",
+            "  zh - Chinese (Whisper large-v3)",
+            "",
+            "⚙️  Processing Options:",
+            "  • Number of speakers: Auto-detect or specify (2, 3, etc.)",
+            "  • Keyword extraction: TF-IDF or TextRank methods",
+            "  • Output formats: JSON (detailed), TXT (readable), CSV (tabular), Plain (text only)",
+            "    - Plain format: Pure text without timestamps or speaker labels",
+            "",
+            "💡 Tips:",
+            "  • For best results, use clean audio with minimal background noise",
+            "  • Specify number of speakers if known for better diarization",
+            "  • Use GPU (CUDA) for faster processing of large files",
+            "  • Check processing history to track your work",
+            "",
+            "🔗 Resources:",
+            "  • README.md - Full documentation",
+            "  • QUICKSTART.md - Quick start guide",
+            "  • MODELS.md - Model comparison and benchmarks",
+            "  • GitHub: https://github.com/llcarn8n/LLCAR",
+        ])
 
         input("\nPress Enter to continue...")
 
@@ -775,34 +1240,49 @@ class InteractiveConsole:
         if sys.platform == 'win32':
             os.system('')  # triggers VT100 processing
 
-        while self.running:
-            self.clear_screen()
-            self.print_header()
-            self.print_menu()
-
-            choice = self.get_input(f"\n  {_BOLD}>{_RESET} Select option", "1")
-
-            if choice == "1":
-                self.process_single_video()
-            elif choice == "2":
-                self.process_single_audio()
-            elif choice == "3":
-                self.batch_process()
-            elif choice == "4":
-                self.quick_process()
-            elif choice == "5":
-                self.view_history()
-            elif choice == "6":
-                self.configure_settings()
-            elif choice == "7":
-                self.show_configuration()
-            elif choice == "8":
-                self.show_help()
-            elif choice in ("0", "q", "exit", "quit"):
-                print(f"\n{_CYAN}Thank you for using LLCAR! Goodbye.{_RESET}\n")
-                self.running = False
-            else:
-                print(f"\n{_RED}Invalid option: {choice}{_RESET}")
-                input("\nPress Enter to continue...")
+        menu_prompt = self._format_prompt(_FMT['menu_prompt'], "1")
+
+        # Flush per frame instead of per line; restored on exit
+        relax_buffering = (getattr(sys.stdout, 'line_buffering', False) is True
+                           and hasattr(sys.stdout, 'reconfigure'))
+        if relax_buffering:
+            sys.stdout.reconfigure(line_buffering=False)
+
+        try:
+            while self.running:
+                ansi = os.environ.get('TERM') != 'dumb'
+                if not ansi:
+                    self.clear_screen()
+                # Whole screen in one write, then read the choice
+                sys.stdout.write(self._render_frame(menu_prompt, clear=ansi))
+                sys.stdout.flush()
+                choice = self._read_input("1")
+
+                if choice == "1":
+                    self.process_single_video()
+                elif choice == "2":
+                    self.process_single_audio()
+                elif choice == "3":
+                    self.batch_process()
+                elif choice == "4":
+                    self.quick_process()
+                elif choice == "5":
+                    self.view_history()
+                elif choice == "6":
+                    self.configure_settings()
+                elif choice == "7":
+                    self.show_configuration()
+                elif choice == "8":
+                    self.show_help()
+                elif choice in ("0", "q", "exit", "quit"):
+                    print(_FMT['goodbye'])
+                    self.running = False
+                else:
+                    print("\n" + _FMT['error'].format(f"Invalid option: {choice}"))
+                    input("\nPress Enter to continue...")
+        finally:
+            sys.stdout.flush()
+            if relax_buffering:
+                sys.stdout.reconfigure(line_buffering=True)
 
         return 0
@@ -3,6 +3,9 @@ Supported File Formats
 Defines all supported video and audio file extensions for the LLCAR pipeline.
 """
 
+import os
+from typing import Union
+
 # Supported video formats
 VIDEO_EXTENSIONS = {
     '.mp4': 'MPEG-4 Video',
@@ -32,6 +35,17 @@ AUDIO_EXTENSIONS = {
 # Combined list of all supported extensions
 ALL_EXTENSIONS = {**VIDEO_EXTENSIONS, **AUDIO_EXTENSIONS}
 
+# Extension sets for the membership checks below
+_VIDEO_EXT = frozenset(VIDEO_EXTENSIONS)
+_AUDIO_EXT = frozenset(AUDIO_EXTENSIONS)
+_ALL_EXT = frozenset(ALL_EXTENSIONS)
+
+
+def _extension(file_path: Union[str, os.PathLike]) -> str:
+    """Return the lowercase extension of file_path ('' if it has none)."""
+    # splitext ignores dots in directory names and leading dots ('.mp4' is a hidden file)
+    return os.path.splitext(os.path.basename(os.fspath(file_path)))[1].lower()
+
 
 def is_video_file(file_path: str) -> bool:
     """
@@ -43,9 +57,7 @@ def is_video_file(file_path: str) -> bool:
     Returns:
         True if file is a supported video format
     """
-    from pathlib import Path
-    ext = Path(file_path).suffix.lower()
-    return ext in VIDEO_EXTENSIONS
+    return _extension(file_path) in _VIDEO_EXT
 
 
 def is_audio_file(file_path: str) -> bool:
@@ -58,9 +70,7 @@ def is_audio_file(file_path: str) -> bool:
     Returns:
         True if file is a supported audio format
     """
-    from pathlib import Path
-    ext = Path(file_path).suffix.lower()
-    return ext in AUDIO_EXTENSIONS
+    return _extension(file_path) in _AUDIO_EXT
 
 
 def is_supported_file(file_path: str) -> bool:
@@ -73,7 +83,7 @@ def is_supported_file(file_path: str) -> bool:
     Returns:
         True if file is supported
     """
-    return is_video_file(file_path) or is_audio_file(file_path)
+    return _extension(file_path) in _ALL_EXT
 
 
 def get_file_type_description(file_path: str) -> str:
@@ -86,6 +96,4 @@ def get_file_type_description(file_path: str) -> str:
     Returns:
         Description of file type or 'Unknown'
     """
-    from pathlib import Path
-    ext = Path(file_path).suffix.lower()
-    return ALL_EXTENSIONS.get(ext, 'Unknown')
+    return ALL_EXTENSIONS.get(_extension(file_path), 'Unknown')
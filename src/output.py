@@ -10,6 +10,12 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,8 +54,17 @@ class OutputFormatter:
         output_path = self.output_dir / filename
 
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if _HAS_ORJSON:
+                # Encoded in C straight to UTF-8 bytes; also handles numpy values
+                payload = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+                with open(output_path, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
 
             logger.info(f"JSON output saved to {output_path}")
             return str(output_path)
@@ -86,16 +101,19 @@ class OutputFormatter:
         try:
             # Use a logical column order: time, speaker, then text fields
             preferred_order = ["start", "end", "speaker", "text", "original_text"]
-            all_keys = set()
-            for segment in segments:
-                all_keys.update(segment.keys())
+            # Union of every segment's keys in one C-level call; sampling only
+            # some rows could silently drop columns from irregular segments
+            all_keys = set().union(*segments)
             fieldnames = [k for k in preferred_order if k in all_keys]
             fieldnames += sorted(all_keys - set(fieldnames))
 
+            # Plain rows let csv.writer skip DictWriter's per-field lookups
+            rows = [[segment.get(k, "") for k in fieldnames] for segment in segments]
+
             with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(segments)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
 
             logger.info(f"CSV output saved to {output_path}")
             return str(output_path)
@@ -129,31 +147,34 @@ class OutputFormatter:
 
         output_path = self.output_dir / filename
 
+        # Only add blank line if we have timestamps or speakers
+        line_end = "\n\n" if include_timestamps or include_speakers else "\n"
+
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for segment in segments:
-                    parts = []
+            # Build the whole transcript first so it is written in one call
+            lines = []
+            for segment in segments:
+                parts = []
 
-                    # Add timestamp
-                    if include_timestamps and "start" in segment and "end" in segment:
-                        start = self._format_timestamp(segment["start"])
-                        end = self._format_timestamp(segment["end"])
-                        parts.append(f"[{start} - {end}]")
+                # Add timestamp
+                if include_timestamps and "start" in segment and "end" in segment:
+                    start = self._format_timestamp(segment["start"])
+                    end = self._format_timestamp(segment["end"])
+                    parts.append(f"[{start} - {end}]")
 
-                    # Add speaker
-                    if include_speakers and "speaker" in segment and segment["speaker"]:
-                        parts.append(f"{segment['speaker']}:")
+                # Add speaker
+                if include_speakers and segment.get("speaker"):
+                    parts.append(f"{segment['speaker']}:")
 
-                    # Add text
-                    text = segment.get("text", "")
-                    if parts:
-                        f.write(" ".join(parts) + " " + text + "\n")
-                    else:
-                        f.write(text + "\n")
+                # Add text
+                text = segment.get("text", "")
+                if parts:
+                    lines.append(" ".join(parts) + " " + text + line_end)
+                else:
+                    lines.append(text + line_end)
 
-                    # Only add blank line if we have timestamps or speakers
-                    if include_timestamps or include_speakers:
-                        f.write("\n")
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write("".join(lines))
 
             logger.info(f"Text output saved to {output_path}")
             return str(output_path)
@@ -213,9 +234,8 @@ class OutputFormatter:
         Returns:
             Formatted timestamp string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
     def create_summary_report(
@@ -249,21 +269,27 @@ class OutputFormatter:
             "segments": segments
         }
 
-        # Calculate statistics
+        # Calculate statistics in a single pass over the segments
         if segments:
-            # Total duration — use max end time across all segments
-            ends = [s["end"] for s in segments if "end" in s]
-            if ends:
-                report["statistics"]["total_duration"] = max(ends)
-
-            # Total words
+            max_end = None
+            total_words = 0
+            speakers = set()
             for segment in segments:
-                text = segment.get("text", "")
-                report["statistics"]["total_words"] += len(text.split())
+                # Total duration — use max end time across all segments
+                end = segment.get("end")
+                if end is not None and (max_end is None or end > max_end):
+                    max_end = end
+
+                total_words += len(segment.get("text", "").split())
+
+                speaker = segment.get("speaker")
+                if speaker:
+                    speakers.add(speaker)
 
-            # Unique speakers
-            speakers = set(s.get("speaker") for s in segments if s.get("speaker"))
-            report["statistics"]["speakers"] = sorted(list(speakers))
+            if max_end is not None:
+                report["statistics"]["total_duration"] = max_end
+            report["statistics"]["total_words"] = total_words
+            report["statistics"]["speakers"] = sorted(speakers)
 
         # Add speaker statistics if available
         if speaker_stats:
@@ -5,18 +5,53 @@ Orchestrates the complete video-to-text processing pipeline.
 
 import logging
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime
 
+import torch
+
 from .audio_extraction import AudioExtractor
 from .diarization import SpeakerDiarizer
 from .transcription import Transcriber
 from .postprocessing import TextPostProcessor, KeywordExtractor
 from .output import OutputFormatter
+from .formats import is_video_file
+from .cache import PipelineCache, DEFAULT_CACHE_DIR
+from . import __version__
 
 logger = logging.getLogger(__name__)
 
+# Bump when post-processing output changes so stale cache entries are ignored
+_POSTPROCESSING_CACHE_VERSION = 1
+
+
+def _package_version(name: str) -> Optional[str]:
+    """Installed version of a distribution, or None if it is not installed."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+# Post-processors hold only compiled patterns and word lists, so pipelines
+# for the same language (e.g. re-created after a settings change) share them
+@lru_cache(maxsize=8)
+def _get_text_processor(language: str) -> TextPostProcessor:
+    """Shared TextPostProcessor for a language."""
+    return TextPostProcessor(language=language)
+
+
+@lru_cache(maxsize=8)
+def _get_keyword_extractor(language: str) -> KeywordExtractor:
+    """Shared KeywordExtractor for a language."""
+    return KeywordExtractor(language=language)
+
 
 class VideoPipeline:
     """
@@ -37,7 +72,18 @@ class VideoPipeline:
         hf_token: Optional[str] = None,
         device: str = "auto",
         output_dir: str = "./output",
-        enable_noise_reduction: bool = True
+        enable_noise_reduction: bool = True,
+        segmentation_batch_size: int = 32,
+        embedding_batch_size: int = 32,
+        compile_models: bool = False,
+        quantize_embedding: bool = False,
+        max_chunk_duration: Optional[float] = 600.0,
+        chunk_overlap: float = 30.0,
+        max_concurrent: int = 4,
+        cache: Optional[Union[str, Path]] = "default",
+        warmup_models: bool = False,
+        compute_type: str = "auto",
+        compile_transcription_model: bool = False
     ):
         """
         Initialize VideoPipeline.
@@ -49,6 +95,24 @@ class VideoPipeline:
             device: Device to use ('cuda', 'cpu', or 'auto')
             output_dir: Directory for output files
             enable_noise_reduction: Enable audio noise reduction filters
+            segmentation_batch_size: Diarization segmentation batch size
+            embedding_batch_size: Diarization speaker embedding batch size
+            compile_models: Compile diarization models with torch.compile
+            quantize_embedding: Quantize the speaker embedding model to int8 on CPU
+            max_chunk_duration: Diarize longer audio in chunks of this many
+                seconds (None or 0 to disable)
+            chunk_overlap: Overlap between diarization chunks in seconds
+            max_concurrent: Number of audio shards transcribed in parallel
+                (batched on CUDA, threaded on CPU)
+            cache: Directory for cached diarization, transcription and
+                post-processing results ("default" for ~/.llcar/cache,
+                None to disable)
+            warmup_models: Run both models once on a second of silence at
+                startup so the first file does not pay CUDA initialization
+            compute_type: Transcription precision ('auto', 'float32',
+                'float16', 'int8')
+            compile_transcription_model: Compile the HuggingFace transcription
+                model with torch.compile (Whisper checkpoints are unaffected)
         """
         self.language = language
         self.model_variant = model_variant
@@ -59,15 +123,47 @@ class VideoPipeline:
         logger.info("Initializing pipeline components...")
 
         self.audio_extractor = AudioExtractor(enable_noise_reduction=enable_noise_reduction)
-        self.diarizer = SpeakerDiarizer(hf_token=hf_token, device=device)
-        self.transcriber = Transcriber(
-            language=language,
-            model_variant=model_variant,
-            device=device
-        )
-        self.text_processor = TextPostProcessor(language=language)
-        self.keyword_extractor = KeywordExtractor(language=language)
+
+        # The two models are independent; load (and warm up) them concurrently
+        def load_diarizer():
+            diarizer = SpeakerDiarizer(
+                hf_token=hf_token,
+                device=device,
+                segmentation_batch_size=segmentation_batch_size,
+                embedding_batch_size=embedding_batch_size,
+                compile_models=compile_models,
+                quantize_embedding=quantize_embedding,
+                max_chunk_duration=max_chunk_duration,
+                chunk_overlap=chunk_overlap
+            )
+            # compile_models already includes a warm-up pass
+            if warmup_models and not compile_models:
+                diarizer.warmup()
+            return diarizer
+
+        def load_transcriber():
+            transcriber = Transcriber(
+                language=language,
+                model_variant=model_variant,
+                device=device,
+                max_concurrent=max_concurrent,
+                compute_type=compute_type,
+                compile_model=compile_transcription_model
+            )
+            # compile_model already includes a warm-up pass
+            if warmup_models and not transcriber.compile_model:
+                transcriber.warmup()
+            return transcriber
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="llcar-load") as loader:
+            diarizer = loader.submit(load_diarizer)
+            transcriber = loader.submit(load_transcriber)
+            self.diarizer = diarizer.result()
+            self.transcriber = transcriber.result()
+        self.text_processor = _get_text_processor(language)
+        self.keyword_extractor = _get_keyword_extractor(language)
         self.output_formatter = OutputFormatter(output_dir=output_dir)
+        self.cache = PipelineCache(DEFAULT_CACHE_DIR if cache == "default" else cache)
 
         logger.info("Pipeline initialized successfully")
 
@@ -76,7 +172,7 @@ class VideoPipeline:
         audio_path: str,
         base_filename: str,
         results: Dict[str, Any],
-        start_time: datetime,
+        start_counter: float,
         num_speakers: Optional[int] = None,
         extract_keywords: bool = True,
         keyword_method: str = "tfidf",
@@ -86,6 +182,8 @@ class VideoPipeline:
         step_offset: int = 0,
         source_path_key: str = "audio_path",
         source_path_value: str = "",
+        audio: Optional[Dict[str, Any]] = None,
+        on_audio_consumed: Optional[Callable[[], None]] = None,
     ) -> Dict[str, Any]:
         """
         Core pipeline logic shared between video and audio processing.
@@ -94,7 +192,7 @@ class VideoPipeline:
             audio_path: Path to audio file to process
             base_filename: Base name for output files
             results: Results dict to populate
-            start_time: Processing start time
+            start_counter: time.perf_counter() value when processing started
             num_speakers: Expected number of speakers (optional)
             extract_keywords: Whether to extract keywords
             keyword_method: Keyword extraction method
@@ -104,13 +202,68 @@ class VideoPipeline:
             step_offset: Current step number offset (for logging)
             source_path_key: Key for source path in metadata
             source_path_value: Value for source path in metadata
+            audio: Waveform already decoded by diarizer.load_audio() (optional)
+            on_audio_consumed: Called once audio_path is no longer needed, e.g.
+                to delete a temporary file before post-processing (optional)
         """
         step = step_offset
 
-        # Speaker diarization
-        step += 1
-        logger.info(f"Step {step}/{total_steps}: Performing speaker diarization...")
-        speaker_segments = self.diarizer.diarize(audio_path, num_speakers=num_speakers)
+        # Diarization and transcription dominate the run time, so their
+        # results are cached by audio content and every setting that affects them
+        # (diarization runs in FP16 on CUDA and FP32 on CPU, hence the device)
+        audio_digest = self.cache.file_digest(audio_path) if self.cache.enabled else None
+        diarization_key = self.cache.key(
+            "diarization", audio_digest, num_speakers, self.diarizer.device,
+            self.diarizer.max_chunk_duration, self.diarizer.chunk_overlap,
+            self.diarizer.quantize_embedding, _package_version("pyannote.audio"), __version__
+        )
+        transcription_key = self.cache.key(
+            "transcription", audio_digest, self.language, self.transcriber.model_name,
+            self.transcriber.backend, self.transcriber.compute_type, self.transcriber.max_concurrent > 1,
+            _package_version("faster-whisper"), _package_version("openai-whisper"),
+            _package_version("transformers"), __version__
+        )
+        speaker_segments = self.cache.get(diarization_key)
+        transcription_segments = self.cache.get(transcription_key)
+        if speaker_segments is not None:
+            logger.info("Diarization results loaded from cache")
+        if transcription_segments is not None:
+            logger.info("Transcription results loaded from cache")
+
+        if speaker_segments is None or transcription_segments is None:
+            # Decode once; diarization and transcription share the waveform
+            if audio is None:
+                audio = self.diarizer.load_audio(audio_path)
+
+            # Diarization and transcription are independent until speakers are
+            # matched, so transcribe on a worker thread while diarizing here
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="llcar-asr") as asr:
+                if transcription_segments is None:
+                    logger.info("Step %d/%d: Transcribing audio to text...", step + 2, total_steps)
+                    transcription = asr.submit(
+                        self.cache.get_or_compute, transcription_key,
+                        lambda: self.transcriber.transcribe(audio_path, audio=audio)
+                    )
+
+                if speaker_segments is None:
+                    logger.info("Step %d/%d: Performing speaker diarization...", step + 1, total_steps)
+                    speaker_segments = self.cache.get_or_compute(
+                        diarization_key,
+                        lambda: self.diarizer.diarize(audio_path, num_speakers=num_speakers, audio=audio)
+                    )
+
+                if transcription_segments is None:
+                    transcription_segments = transcription.result()
+        # The decoded waveform (possibly in VRAM) and the audio file are not
+        # needed past this point
+        del audio
+        if on_audio_consumed is not None:
+            on_audio_consumed()
+        step += 2
+        transcription_segments = self.transcriber.assign_speakers(
+            transcription_segments, speaker_segments
+        )
+
         speaker_stats = self.diarizer.get_speaker_statistics(speaker_segments)
         results["steps"]["diarization"] = {
             "num_segments": len(speaker_segments),
@@ -118,34 +271,44 @@ class VideoPipeline:
             "speaker_stats": speaker_stats,
             "status": "completed"
         }
-        logger.info(f"Diarization completed: {len(speaker_segments)} segments, {len(speaker_stats)} speakers")
+        logger.info("Diarization completed: %d segments, %d speakers", len(speaker_segments), len(speaker_stats))
 
-        # Transcription
-        step += 1
-        logger.info(f"Step {step}/{total_steps}: Transcribing audio to text...")
-        transcription_segments = self.transcriber.transcribe(
-            audio_path,
-            speaker_segments=speaker_segments
-        )
         results["steps"]["transcription"] = {
             "num_segments": len(transcription_segments),
             "status": "completed"
         }
-        logger.info(f"Transcription completed: {len(transcription_segments)} segments")
+        logger.info("Transcription completed: %d segments", len(transcription_segments))
 
         # Post-processing
         step += 1
-        logger.info(f"Step {step}/{total_steps}: Post-processing text...")
-        processed_segments = self.text_processor.process_segments(transcription_segments)
+        logger.info("Step %d/%d: Post-processing text...", step, total_steps)
+        # Hashing the whole transcript is only worth it when the cache is on
+        cache_key = cached = None
+        if self.cache.enabled:
+            cache_key = self._postprocessing_cache_key(
+                transcription_segments, extract_keywords, keyword_method, top_keywords
+            )
+            cached = self.cache.get(cache_key)
+        if cached is not None:
+            processed_segments, keywords = cached["segments"], cached["keywords"]
+            logger.info("Post-processing results loaded from cache")
+        else:
+            # The raw segments are not used past this point, so clean them in place
+            processed_segments = self.text_processor.process_segments(
+                transcription_segments, inplace=True
+            )
 
-        keywords = []
+            keywords = []
+            if extract_keywords:
+                keywords = self.keyword_extractor.extract_keywords_from_segments(
+                    processed_segments,
+                    method=keyword_method,
+                    top_n=top_keywords
+                )
+            if cache_key is not None:
+                self.cache.put(cache_key, {"segments": processed_segments, "keywords": keywords})
         if extract_keywords:
-            keywords = self.keyword_extractor.extract_keywords_from_segments(
-                processed_segments,
-                method=keyword_method,
-                top_n=top_keywords
-            )
-            logger.info(f"Extracted {len(keywords)} keywords")
+            logger.info("Extracted %d keywords", len(keywords))
 
         results["steps"]["postprocessing"] = {
             "num_keywords": len(keywords),
@@ -155,7 +318,7 @@ class VideoPipeline:
 
         # Generate output
         step += 1
-        logger.info(f"Step {step}/{total_steps}: Generating output files...")
+        logger.info("Step %d/%d: Generating output files...", step, total_steps)
 
         report = self.output_formatter.create_summary_report(
             segments=processed_segments,
@@ -164,42 +327,39 @@ class VideoPipeline:
             metadata={
                 source_path_key: source_path_value,
                 "language": self.language,
-                "processing_time": (datetime.now() - start_time).total_seconds()
+                "processing_time": time.perf_counter() - start_counter
             }
         )
 
         if save_formats is None:
             save_formats = ["json", "txt"]
 
-        output_files = {}
+        writers = {}
 
         if "json" in save_formats:
-            json_path = self.output_formatter.save_json(
-                report,
-                filename=f"{base_filename}_report.json"
-            )
-            output_files["json"] = json_path
+            writers["json"] = (self.output_formatter.save_json, report, f"{base_filename}_report.json")
 
         if "csv" in save_formats:
-            csv_path = self.output_formatter.save_csv(
-                processed_segments,
-                filename=f"{base_filename}_segments.csv"
-            )
-            output_files["csv"] = csv_path
+            writers["csv"] = (self.output_formatter.save_csv, processed_segments, f"{base_filename}_segments.csv")
 
         if "txt" in save_formats:
-            txt_path = self.output_formatter.save_text(
-                processed_segments,
-                filename=f"{base_filename}_transcript.txt"
-            )
-            output_files["txt"] = txt_path
+            writers["txt"] = (self.output_formatter.save_text, processed_segments, f"{base_filename}_transcript.txt")
 
         if "plain" in save_formats or "plain_text" in save_formats:
-            plain_txt_path = self.output_formatter.save_plain_text(
-                processed_segments,
-                filename=f"{base_filename}_plain.txt"
+            writers["plain_text"] = (
+                self.output_formatter.save_plain_text, processed_segments, f"{base_filename}_plain.txt"
             )
-            output_files["plain_text"] = plain_txt_path
+
+        # Each format goes to its own file, so write them concurrently and
+        # let their disk I/O overlap
+        output_files = {}
+        if writers:
+            with ThreadPoolExecutor(max_workers=len(writers), thread_name_prefix="llcar-out") as pool:
+                futures = {
+                    fmt: pool.submit(save, data, filename=filename)
+                    for fmt, (save, data, filename) in writers.items()
+                }
+                output_files = {fmt: future.result() for fmt, future in futures.items()}
 
         results["steps"]["output"] = {
             "output_files": output_files,
@@ -211,14 +371,44 @@ class VideoPipeline:
         results["keywords"] = keywords
         results["speaker_statistics"] = speaker_stats
         results["output_files"] = output_files
+        # Elapsed time comes from the monotonic clock, immune to wall-clock steps
         results["end_time"] = datetime.now().isoformat()
-        results["total_processing_time"] = (datetime.now() - start_time).total_seconds()
+        results["total_processing_time"] = time.perf_counter() - start_counter
         results["status"] = "completed"
 
-        logger.info(f"Pipeline completed successfully in {results['total_processing_time']:.2f}s")
+        logger.info("Pipeline completed successfully in %.2fs", results["total_processing_time"])
 
         return results
 
+    def _postprocessing_cache_key(
+        self,
+        segments: List[Dict[str, Any]],
+        extract_keywords: bool,
+        keyword_method: str,
+        top_keywords: int
+    ) -> str:
+        """
+        Hash the transcription and post-processing settings into a cache key.
+
+        Args:
+            segments: Transcription segments
+            extract_keywords: Whether keywords are extracted
+            keyword_method: Keyword extraction method
+            top_keywords: Number of top keywords
+
+        Returns:
+            Hex digest identifying the post-processing result
+        """
+        # Keywords depend on the installed scikit-learn/summa and on whether
+        # optional tokenizers (jieba, nltk stop words) were available
+        return self.cache.key(
+            "postprocessing", _POSTPROCESSING_CACHE_VERSION, self.language,
+            extract_keywords, keyword_method, top_keywords,
+            self.keyword_extractor.tokenization, _package_version("scikit-learn"),
+            _package_version("summa"), _package_version("jieba"), _package_version("nltk"),
+            __version__, segments
+        )
+
     def process_video(
         self,
         video_path: str,
@@ -226,7 +416,9 @@ class VideoPipeline:
         extract_keywords: bool = True,
         keyword_method: str = "tfidf",
         top_keywords: int = 10,
-        save_formats: Optional[List[str]] = None
+        save_formats: Optional[List[str]] = None,
+        extracted_audio_path: Optional[str] = None,
+        audio: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Process video file through the complete pipeline.
@@ -238,6 +430,10 @@ class VideoPipeline:
             keyword_method: Keyword extraction method ('tfidf' or 'textrank')
             top_keywords: Number of top keywords to extract
             save_formats: List of output formats ('json', 'csv', 'txt')
+            extracted_audio_path: Audio already extracted by prefetch_audio()
+                (optional); it is removed once processing finishes
+            audio: Waveform of extracted_audio_path already decoded by
+                diarizer.load_audio() (optional)
 
         Returns:
             Processing results dictionary
@@ -247,7 +443,16 @@ class VideoPipeline:
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         start_time = datetime.now()
-        logger.info(f"Starting pipeline for video: {video_path}")
+        start_counter = time.perf_counter()
+        logger.info("Starting pipeline for video: %s", video_path)
+
+        def remove_extracted_audio():
+            # Clean up extracted temporary audio file
+            try:
+                os.remove(extracted_audio_path)
+                logger.debug("Cleaned up temporary audio file: %s", extracted_audio_path)
+            except OSError:
+                pass
 
         results = {
             "video_path": str(video_path),
@@ -257,25 +462,25 @@ class VideoPipeline:
             "steps": {}
         }
 
-        extracted_audio_path = None
         try:
-            # Step 1: Extract audio
+            # Step 1: Extract audio (unless it was prefetched)
             logger.info("Step 1/5: Extracting audio from video...")
-            extracted_audio_path = self.audio_extractor.extract_audio(str(video_path))
+            if extracted_audio_path is None:
+                extracted_audio_path = self.audio_extractor.extract_audio(str(video_path))
             duration = self.audio_extractor.get_audio_duration(extracted_audio_path)
             results["steps"]["audio_extraction"] = {
                 "audio_path": extracted_audio_path,
                 "duration": duration,
                 "status": "completed"
             }
-            logger.info(f"Audio extracted: {extracted_audio_path} (duration: {duration:.2f}s)")
+            logger.info("Audio extracted: %s (duration: %.2fs)", extracted_audio_path, duration)
 
             # Steps 2-5: Shared pipeline
             return self._run_pipeline(
                 audio_path=extracted_audio_path,
                 base_filename=video_path.stem,
                 results=results,
-                start_time=start_time,
+                start_counter=start_counter,
                 num_speakers=num_speakers,
                 extract_keywords=extract_keywords,
                 keyword_method=keyword_method,
@@ -285,23 +490,49 @@ class VideoPipeline:
                 step_offset=1,
                 source_path_key="video_path",
                 source_path_value=str(video_path),
+                audio=audio,
+                on_audio_consumed=remove_extracted_audio,
             )
 
         except Exception as e:
-            logger.error(f"Pipeline failed: {e}")
+            logger.error("Pipeline failed: %s", e)
             results["status"] = "failed"
             results["error"] = str(e)
             results["end_time"] = datetime.now().isoformat()
             raise
 
         finally:
-            # Clean up extracted temporary audio file
+            # Normally already removed once transcription finished; this
+            # covers failures before that point
             if extracted_audio_path:
-                try:
-                    os.remove(extracted_audio_path)
-                    logger.debug(f"Cleaned up temporary audio file: {extracted_audio_path}")
-                except OSError:
-                    pass
+                remove_extracted_audio()
+
+    def prefetch_audio(self, video_path: str) -> str:
+        """
+        Extract a video's audio ahead of process_video().
+
+        Extraction is ffmpeg-bound, so callers can run it in a background
+        thread for the next file while the current one is being transcribed,
+        then pass the result as process_video(extracted_audio_path=...).
+        A unique file name is used so prefetches never collide with each
+        other or with an extraction done by process_video().
+
+        Args:
+            video_path: Path to input video file
+
+        Returns:
+            Path to the extracted audio file
+        """
+        video_path = Path(video_path)
+        tmp_dir = Path(tempfile.gettempdir()) / "llcar"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, output_path = tempfile.mkstemp(suffix=".wav", prefix=f"{video_path.stem}_", dir=tmp_dir)
+        os.close(fd)
+        try:
+            return self.audio_extractor.extract_audio(str(video_path), output_path)
+        except Exception:
+            os.remove(output_path)
+            raise
 
     def process_audio(
         self,
@@ -310,7 +541,8 @@ class VideoPipeline:
         extract_keywords: bool = True,
         keyword_method: str = "tfidf",
         top_keywords: int = 10,
-        save_formats: Optional[List[str]] = None
+        save_formats: Optional[List[str]] = None,
+        audio: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Process audio file directly (skip audio extraction step).
@@ -322,6 +554,7 @@ class VideoPipeline:
             keyword_method: Keyword extraction method ('tfidf' or 'textrank')
             top_keywords: Number of top keywords to extract
             save_formats: List of output formats ('json', 'csv', 'txt')
+            audio: Waveform already decoded by diarizer.load_audio() (optional)
 
         Returns:
             Processing results dictionary
@@ -331,7 +564,8 @@ class VideoPipeline:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         start_time = datetime.now()
-        logger.info(f"Starting pipeline for audio: {audio_path}")
+        start_counter = time.perf_counter()
+        logger.info("Starting pipeline for audio: %s", audio_path)
 
         results = {
             "audio_path": str(audio_path),
@@ -351,7 +585,7 @@ class VideoPipeline:
                 audio_path=str(audio_path),
                 base_filename=audio_path.stem,
                 results=results,
-                start_time=start_time,
+                start_counter=start_counter,
                 num_speakers=num_speakers,
                 extract_keywords=extract_keywords,
                 keyword_method=keyword_method,
@@ -361,11 +595,103 @@ class VideoPipeline:
                 step_offset=0,
                 source_path_key="audio_path",
                 source_path_value=str(audio_path),
+                audio=audio,
             )
 
         except Exception as e:
-            logger.error(f"Pipeline failed: {e}")
+            logger.error("Pipeline failed: %s", e)
             results["status"] = "failed"
             results["error"] = str(e)
             results["end_time"] = datetime.now().isoformat()
             raise
+
+    def _prepare_input(
+        self,
+        file_path: str,
+        stream: Optional["torch.cuda.Stream"] = None
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Extract (for video) and decode a file's audio ahead of processing.
+
+        Args:
+            file_path: Path to input video or audio file
+            stream: CUDA stream to issue the device upload on (optional)
+
+        Returns:
+            Tuple of (extracted audio path or None for audio input, waveform dict)
+        """
+        extracted = self.prefetch_audio(file_path) if is_video_file(file_path) else None
+        try:
+            if stream is None:
+                return extracted, self.diarizer.load_audio(extracted or file_path)
+            with torch.cuda.stream(stream):
+                return extracted, self.diarizer.load_audio(extracted or file_path)
+        except Exception:
+            if extracted:
+                os.remove(extracted)
+            raise
+
+    def process_batch(
+        self,
+        file_paths: List[str],
+        on_start: Optional[Callable[[str], None]] = None,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        **options
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several video/audio files, overlapping input preparation.
+
+        While one file runs through diarization and transcription, the next
+        file's audio is extracted and decoded on a background thread. On CUDA
+        its upload runs on a separate stream so it does not queue behind the
+        current file's kernels. A failing file is recorded and the batch
+        continues.
+
+        Args:
+            file_paths: Paths to input video or audio files
+            on_start: Called with file_path before each file is processed,
+                e.g. to report progress (optional)
+            on_result: Called with (file_path, results) as each file finishes,
+                e.g. to report progress (optional)
+            **options: Processing options passed to process_video()/process_audio()
+
+        Returns:
+            One results dictionary per file, in input order
+        """
+        stream = torch.cuda.Stream() if self.diarizer.device == "cuda" else None
+        batch_results = []
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="llcar-prep") as prep:
+            pending = prep.submit(self._prepare_input, file_paths[0], stream) if file_paths else None
+
+            for idx, file_path in enumerate(file_paths):
+                current = pending
+                if idx + 1 < len(file_paths):
+                    pending = prep.submit(self._prepare_input, file_paths[idx + 1], stream)
+
+                if on_start is not None:
+                    on_start(file_path)
+                try:
+                    extracted, audio = current.result()
+                    if stream is not None:
+                        # Make the upload visible to the inference stream
+                        torch.cuda.current_stream().wait_stream(stream)
+                        audio["waveform"].record_stream(torch.cuda.current_stream())
+
+                    if extracted:
+                        results = self.process_video(
+                            file_path, extracted_audio_path=extracted, audio=audio, **options
+                        )
+                    else:
+                        results = self.process_audio(file_path, audio=audio, **options)
+                except Exception as e:
+                    logger.error("Batch item failed: %s: %s", file_path, e)
+                    results = {"input_path": str(file_path), "status": "failed", "error": str(e)}
+
+                batch_results.append(results)
+                if on_result is not None:
+                    on_result(file_path, results)
+                # Drop this file's waveform before the next one is taken
+                current = audio = None
+
+        return batch_results
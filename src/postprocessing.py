@@ -5,12 +5,28 @@ Cleans text, removes filler words, extracts keywords, and performs NER.
 
 import re
 import logging
-from typing import List, Dict, Any, Set
-from sklearn.feature_extraction.text import TfidfVectorizer
-from summa import keywords as summa_keywords
+from importlib.util import find_spec
+from typing import List, Dict, Any, Optional, Set
+import numpy as np
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+# sklearn, summa and jieba are imported where they are used, so that text
+# cleaning alone does not pay for their (scipy-heavy) import chains
 
 logger = logging.getLogger(__name__)
 
+_PUNCT = '.,!?;:'
+# Joins segment texts for batched regex passes; the NUL stops phrase fillers
+# and profanity matches from spanning two segments
+_SEGMENT_SEP = '\n\0\n'
+_DUP_PUNCT_RE = re.compile(r'([.,!?;:])\1+')
+_WORD_TAIL_RE = re.compile(r'\w*')
+
 _nltk_data_ensured = False
 
 
@@ -28,6 +44,126 @@ def _ensure_nltk_data():
     _nltk_data_ensured = True
 
 
+# summa's part-of-speech filter (applies only when its tagger is installed)
+_TEXTRANK_TAGS = frozenset(['NN', 'JJ'])
+_TEXTRANK_DAMPING = 0.85
+
+
+def _pagerank(edges_a: np.ndarray, edges_b: np.ndarray, degree: np.ndarray) -> np.ndarray:
+    """
+    PageRank of an undirected graph by sparse power iteration.
+
+    Args:
+        edges_a, edges_b: Node indices of each edge (no self-loops)
+        degree: Number of neighbours per node, counting a self-loop
+
+    Returns:
+        Stationary scores, summing to 1
+    """
+    from scipy.sparse import csr_matrix
+
+    n = len(degree)
+    src = np.concatenate([edges_a, edges_b])
+    dst = np.concatenate([edges_b, edges_a])
+    # Transposed transition matrix, so each step is one sparse mat-vec
+    transition = csr_matrix((1.0 / degree[src], (dst, src)), shape=(n, n))
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(1000):
+        updated = _TEXTRANK_DAMPING * (transition @ scores) + (1 - _TEXTRANK_DAMPING) * scores.sum() / n
+        updated /= updated.sum()
+        converged = np.abs(updated - scores).sum() < 1e-8
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def _textrank(text: str, words: Optional[int], ratio: float) -> List[str]:
+    """
+    TextRank keywords, equivalent to summa.keywords.keywords(split=True).
+
+    Uses summa's word cleaning (stop words, stemming) but builds the
+    co-occurrence graph with NumPy and ranks it by sparse power iteration;
+    summa builds a dense adjacency matrix in Python and solves a full
+    eigenproblem, which is cubic in vocabulary size.
+
+    Args:
+        text: Input text
+        words: Number of lemmas to keep (None to use ratio)
+        ratio: Fraction of lemmas to keep when words is None
+
+    Returns:
+        Keywords and adjacent-keyword phrases, best first
+    """
+    from summa.preprocessing.textcleaner import clean_text_by_word, tokenize_by_word
+
+    tokens = clean_text_by_word(text)
+    lemma_ids = {}
+    for unit in tokens.values():
+        if not unit.tag or unit.tag in _TEXTRANK_TAGS:
+            lemma_ids.setdefault(unit.token, len(lemma_ids))
+    if not lemma_ids:
+        return []
+
+    # Edges join the lemmas of adjacent words; stop words break adjacency
+    ids = np.array(
+        [lemma_ids.get(tokens[w].token, -1) if w in tokens else -1 for w in tokenize_by_word(text)],
+        dtype=np.int64
+    )
+    a, b = ids[:-1], ids[1:]
+    keep = (a >= 0) & (b >= 0)
+    n = len(lemma_ids)
+    pairs = np.unique(np.minimum(a[keep], b[keep]) * n + np.maximum(a[keep], b[keep]))
+    lo, hi = pairs // n, pairs % n
+    loop = lo == hi
+    degree = np.bincount(lo, minlength=n) + np.bincount(hi[~loop], minlength=n)
+
+    # Lemmas without neighbours are dropped from the graph
+    nodes = np.flatnonzero(degree)
+    if not len(nodes):
+        return []
+    position = np.full(n, -1)
+    position[nodes] = np.arange(len(nodes))
+    scores = _pagerank(position[lo[~loop]], position[hi[~loop]], degree[nodes].astype(np.float64))
+
+    lemmas = list(lemma_ids)
+    order = sorted(range(len(nodes)), key=lambda i: scores[i], reverse=True)
+    count = min(int(len(nodes) * ratio) if words is None else words, len(nodes))
+    top_lemmas = {lemmas[nodes[i]]: scores[i] for i in order[:count]}
+    word_scores = {w: top_lemmas[unit.token] for w, unit in tokens.items() if unit.token in top_lemmas}
+
+    # Join runs of adjacent keywords into phrases (as summa does)
+    raw_words = text.split()
+    remaining = dict(word_scores)
+    phrases = []
+    for i, raw in enumerate(raw_words):
+        word = next(tokenize_by_word(raw), "")
+        if word not in remaining:
+            continue
+        phrase = [word]
+        if i + 1 == len(raw_words):
+            phrases.append(word)
+        for following in raw_words[i + 1:]:
+            other = next(tokenize_by_word(following), "")
+            if other in remaining and other == following and other not in phrase:
+                phrase.append(other)
+            else:
+                for w in phrase:
+                    remaining.pop(w)
+                phrases.append(" ".join(phrase))
+                break
+
+    phrases.sort(key=lambda p: sum(word_scores[w] for w in p.split()) / len(p.split()), reverse=True)
+    return phrases
+
+
+def _tokenize_zh(text: str) -> List[str]:
+    """Segment Chinese text into words with jieba, dropping punctuation and spaces."""
+    import jieba
+    return [w for w in jieba.lcut(text) if any(c.isalnum() for c in w)]
+
+
 class TextPostProcessor:
     """Post-processes transcribed text."""
 
@@ -76,8 +212,6 @@ class TextPostProcessor:
             remove_fillers: Whether to remove filler words
             remove_profanity: Whether to censor profanity
         """
-        _ensure_nltk_data()
-
         self.language = language
         self.remove_fillers = remove_fillers
         self.remove_profanity = remove_profanity
@@ -93,12 +227,33 @@ class TextPostProcessor:
             self.single_fillers = self.ENGLISH_SINGLE_FILLERS
             self.phrase_fillers = self.ENGLISH_PHRASE_FILLERS
 
+        # One alternation for all fillers (longest first to avoid partial
+        # matches): phrases match at word boundaries across any whitespace,
+        # single fillers only as whole whitespace-separated words, so "well,"
+        # and "well-known" stay
+        phrases = '|'.join(
+            re.escape(p).replace(r'\ ', r'\s+')
+            for p in sorted(self.phrase_fillers, key=len, reverse=True)
+        )
+        words = '|'.join(re.escape(w) for w in sorted(self.single_fillers, key=len, reverse=True))
+        self._filler_re = re.compile(
+            r'\b(?:' + phrases + r')\b|(?<!\S)(?:' + words + r')(?!\S)', re.IGNORECASE
+        )
+
         # Build profanity pattern from curated word list
+        self._profanity_automaton = None
         if language == "ru" and self.RUSSIAN_PROFANITY_STEMS:
             escaped = [re.escape(stem) for stem in self.RUSSIAN_PROFANITY_STEMS]
             self._profanity_pattern = re.compile(
                 r'\b\w*(?:' + '|'.join(escaped) + r')\w*\b', re.IGNORECASE
             )
+            if _HAS_AHOCORASICK:
+                # Finds all stems in one linear pass instead of backtracking
+                # through the alternation at every position of every word
+                self._profanity_automaton = ahocorasick.Automaton()
+                for stem in self.RUSSIAN_PROFANITY_STEMS:
+                    self._profanity_automaton.add_word(stem.lower(), len(stem))
+                self._profanity_automaton.make_automaton()
         else:
             self._profanity_pattern = None
 
@@ -117,70 +272,107 @@ class TextPostProcessor:
         if not text:
             return ""
 
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        return self._clean_words(self._apply_patterns(text))
 
-        # Remove filler words
+    def _apply_patterns(self, text: str) -> str:
+        """Run the whole-string filler and profanity regexes."""
         if self.remove_fillers:
-            text = self._remove_fillers(text)
+            text = self._filler_re.sub('', text)
 
-        # Censor profanity
         if self.remove_profanity and self._profanity_pattern:
             text = self._censor_profanity(text)
 
-        # Remove duplicate consecutive words
-        text = self._remove_duplicates(text)
+        return text
 
-        # Clean up punctuation
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-        text = re.sub(r'([.,!?;:])\1+', r'\1', text)
-
-        return text.strip()
-
-    def _remove_fillers(self, text: str) -> str:
-        """Remove filler words and phrases from text."""
-        # First remove multi-word phrases (longest first to avoid partial matches)
-        for phrase in sorted(self.phrase_fillers, key=len, reverse=True):
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-            text = pattern.sub('', text)
-
-        # Then remove single-word fillers
-        words = text.split()
-        cleaned_words = [w for w in words if w.lower() not in self.single_fillers]
-        return ' '.join(cleaned_words)
+    def _clean_words(self, text: str) -> str:
+        """
+        Collapse whitespace, drop consecutive duplicate words and attach
+        punctuation to the word before it, in a single walk over the words.
+        """
+        words = []
+        prev_lower = None
+        for word in text.split():
+            lower = word.lower()
+            if lower == prev_lower:
+                continue
+            prev_lower = lower
+            if words and word[0] in _PUNCT:
+                words[-1] += word
+            else:
+                words.append(word)
+
+        return _DUP_PUNCT_RE.sub(r'\1', ' '.join(words))
 
     def _censor_profanity(self, text: str) -> str:
         """Censor profanity using curated word list."""
-        return self._profanity_pattern.sub('***', text)
-
-    def _remove_duplicates(self, text: str) -> str:
-        """Remove consecutive duplicate words."""
-        words = text.split()
-        if not words:
-            return ""
-
-        cleaned = [words[0]]
-        for i in range(1, len(words)):
-            if words[i].lower() != words[i - 1].lower():
-                cleaned.append(words[i])
-
-        return ' '.join(cleaned)
-
-    def process_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        lowered = text.lower()
+        # lower() can change the length of a few characters, which would shift offsets
+        if self._profanity_automaton is None or len(lowered) != len(text):
+            return self._profanity_pattern.sub('***', text)
+
+        # Like the regex, replace each whole word that contains a stem
+        parts = []
+        pos = 0
+        for last, length in self._profanity_automaton.iter(lowered):
+            if last < pos:
+                # Another stem in a word that is already censored
+                continue
+            start = last - length + 1
+            while start > pos and (lowered[start - 1].isalnum() or lowered[start - 1] == '_'):
+                start -= 1
+            parts.append(text[pos:start])
+            parts.append('***')
+            pos = _WORD_TAIL_RE.match(lowered, last + 1).end()
+
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return ''.join(parts)
+
+    def process_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        inplace: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Process all transcription segments.
 
         Args:
             segments: List of transcription segments
+            inplace: Update the given segment dicts instead of copying them
+                (for callers that own the segments and no longer need them)
 
         Returns:
             List of processed segments
         """
+        texts = [segment.get("text") or "" for segment in segments]
+        # Short utterances ("yeah", "okay") repeat a lot; clean each distinct text once
+        unique = list(dict.fromkeys(texts))
+
+        # Run the regexes once over all segments rather than once per segment
+        joined = _SEGMENT_SEP.join(unique)
+        if joined.count('\0') == max(len(unique) - 1, 0):
+            patterned = self._apply_patterns(joined).split('\0')
+        else:
+            patterned = [self._apply_patterns(text) for text in unique]
+        cleaned = {}
+        for text, p in zip(unique, patterned):
+            words = self._clean_words(p)
+            # Already-clean texts keep the original object, so "text" and
+            # "original_text" share one string instead of holding two copies
+            cleaned[text] = text if words == text else words
+
+        if inplace:
+            for segment, text in zip(segments, texts):
+                segment["original_text"] = segment.get("text", "")
+                segment["text"] = cleaned[text]
+            return segments
+
         processed_segments = []
 
-        for segment in segments:
+        for segment, text in zip(segments, texts):
             processed_segment = segment.copy()
-            processed_segment["text"] = self.clean_text(segment.get("text", ""))
+            processed_segment["text"] = cleaned[text]
             processed_segment["original_text"] = segment.get("text", "")
             processed_segments.append(processed_segment)
 
@@ -199,6 +391,29 @@ class KeywordExtractor:
         """
         self.language = language
 
+        # Tokenizer and stop words for TF-IDF, resolved once per extractor.
+        # tokenization names the path taken, since keywords differ with the
+        # optional packages installed (callers include it in cache keys)
+        self._tfidf_options = {}
+        self.tokenization = "default"
+        if language == 'en':
+            self._tfidf_options["stop_words"] = 'english'
+        elif language == 'ru':
+            try:
+                _ensure_nltk_data()
+                from nltk.corpus import stopwords
+                self._tfidf_options["stop_words"] = stopwords.words('russian')
+                self.tokenization = "nltk-stopwords"
+            except (LookupError, OSError) as e:
+                logger.warning(f"Russian stop words unavailable: {e}")
+        elif language == 'zh':
+            # The default token pattern treats a whole run of hanzi as one word
+            if find_spec("jieba") is not None:
+                self._tfidf_options.update(tokenizer=_tokenize_zh, token_pattern=None)
+                self.tokenization = "jieba"
+            else:
+                logger.warning("jieba is not installed; Chinese keywords will be less accurate")
+
     def extract_tfidf_keywords(
         self,
         texts: List[str],
@@ -216,19 +431,19 @@ class KeywordExtractor:
         Returns:
             List of keyword dictionaries with scores
         """
-        if not texts or all(not t.strip() for t in texts):
-            return []
+        from sklearn.feature_extraction.text import TfidfVectorizer
 
         # Filter out empty texts
         docs = [t for t in texts if t.strip()]
-        if not docs:
+        if not docs or top_n <= 0:
             return []
 
         try:
             vectorizer = TfidfVectorizer(
                 max_features=max_features,
-                stop_words='english' if self.language == 'en' else None,
-                ngram_range=(1, 2)
+                ngram_range=(1, 2),
+                dtype=np.float32,
+                **self._tfidf_options
             )
 
             # Each segment is a separate document for proper IDF calculation
@@ -236,18 +451,15 @@ class KeywordExtractor:
 
             # Average TF-IDF scores across all documents
             feature_names = vectorizer.get_feature_names_out()
-            avg_scores = tfidf_matrix.mean(axis=0).A1
+            avg_scores = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
 
-            # Sort by score
-            keyword_scores = sorted(
-                zip(feature_names, avg_scores),
-                key=lambda x: x[1],
-                reverse=True
-            )
+            # Highest scores first; the sort is stable, so terms tied at the
+            # top_n boundary are taken in vocabulary order, as sorted() did
+            top = np.argsort(-avg_scores, kind='stable')[:top_n]
 
             return [
-                {"keyword": kw, "score": float(score)}
-                for kw, score in keyword_scores[:top_n]
+                {"keyword": feature_names[i], "score": float(avg_scores[i])}
+                for i in top
             ]
 
         except Exception as e:
@@ -275,16 +487,10 @@ class KeywordExtractor:
             return []
 
         try:
-            # Use summa library for TextRank
-            keywords_str = summa_keywords.keywords(
-                text,
-                ratio=ratio,
-                words=top_n,
-                split=True
-            )
-
-            return keywords_str if keywords_str else []
+            return _textrank(text, words=top_n, ratio=ratio)
 
+        except ImportError:
+            raise
         except Exception as e:
             logger.error(f"Error extracting TextRank keywords: {e}")
             return []
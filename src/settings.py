@@ -0,0 +1,48 @@
+"""
+Pipeline Settings
+Maps a loaded configuration (config.yaml) to VideoPipeline arguments.
+
+Kept free of heavy imports so the console can build worker arguments
+without loading torch.
+"""
+
+from typing import Any, Dict
+
+
+def pipeline_kwargs(config: Dict[str, Any], **overrides) -> Dict[str, Any]:
+    """
+    Build VideoPipeline keyword arguments from a configuration dictionary.
+
+    Args:
+        config: Configuration as loaded from config.yaml (may be partial)
+        **overrides: Values that take precedence over the configuration,
+            e.g. command-line arguments or a language chosen at a prompt
+
+    Returns:
+        Keyword arguments for VideoPipeline
+    """
+    diarization = config.get('diarization') or {}
+    transcription = config.get('transcription') or {}
+
+    kwargs = {
+        'language': config.get('language', 'en'),
+        'model_variant': config.get('model_variant', 'default'),
+        'hf_token': config.get('hf_token'),
+        'device': config.get('device', 'auto'),
+        'output_dir': (config.get('output') or {}).get('directory', './output'),
+        'enable_noise_reduction': (config.get('audio') or {}).get('noise_reduction', True),
+        'segmentation_batch_size': diarization.get('segmentation_batch_size', 32),
+        'embedding_batch_size': diarization.get('embedding_batch_size', 32),
+        'compile_models': diarization.get('compile_models', False),
+        'quantize_embedding': diarization.get('quantize_embedding', False),
+        'max_chunk_duration': diarization.get('max_chunk_duration', 600),
+        'chunk_overlap': diarization.get('chunk_overlap', 30),
+        'max_concurrent': transcription.get('max_concurrent', 4),
+        'compute_type': transcription.get('compute_type', 'auto'),
+        'compile_transcription_model': transcription.get('compile_model', False),
+        # "default" is ~/.llcar/cache; null disables the result cache
+        'cache': (config.get('cache') or {}).get('directory', 'default'),
+        'warmup_models': config.get('warmup_models', False),
+    }
+    kwargs.update(overrides)
+    return kwargs
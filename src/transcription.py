@@ -9,8 +9,10 @@ Supports:
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, Tuple
+import numpy as np
 import torch
 from transformers import pipeline
 import whisper
@@ -34,6 +36,83 @@ LANGUAGE_MODELS = {
     }
 }
 
+# Long audio is split into shards of roughly this many seconds, cut at the
+# quietest frame within SILENCE_SEARCH_WINDOW seconds of each target point
+SHARD_DURATION = 300.0
+SILENCE_SEARCH_WINDOW = 15.0
+SILENCE_FRAME = 0.05
+
+
+def _split_on_silence(
+    waveform: np.ndarray,
+    sample_rate: int,
+    shard_duration: float = SHARD_DURATION,
+    search_window: float = SILENCE_SEARCH_WINDOW
+) -> List[Tuple[int, int]]:
+    """
+    Choose shard boundaries at pauses in speech.
+
+    Args:
+        waveform: Mono waveform
+        sample_rate: Sample rate of the waveform
+        shard_duration: Target shard length in seconds
+        search_window: How far (seconds) a cut may move from its target point
+
+    Returns:
+        List of (start_sample, end_sample) covering the whole waveform
+    """
+    total = len(waveform)
+    shard = int(shard_duration * sample_rate)
+    if total <= shard + shard // 2:
+        return [(0, total)]
+
+    frame = int(SILENCE_FRAME * sample_rate)
+    n_frames = total // frame
+    energy = np.square(waveform[:n_frames * frame].reshape(n_frames, frame)).mean(axis=1)
+    window = int(search_window / SILENCE_FRAME)
+
+    cuts = [0]
+    # Don't leave a short tail: the last shard absorbs up to half a shard extra
+    while total - cuts[-1] > shard + shard // 2:
+        target = (cuts[-1] + shard) // frame
+        lo = max(target - window, cuts[-1] // frame + 1)
+        hi = min(target + window + 1, n_frames)
+        cuts.append((lo + int(np.argmin(energy[lo:hi]))) * frame)
+    cuts.append(total)
+
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+# Speaker diarization segments sorted by start time, as parallel arrays:
+# (starts, reach, ends, labels, order) where reach[i] = max(ends[:i + 1]) and
+# order holds each segment's position in the original list
+SpeakerTable = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _speaker_table(
+    speaker_segments: Optional[List[Dict[str, Any]]]
+) -> Optional[SpeakerTable]:
+    """
+    Convert speaker segments to sorted arrays for interval search.
+
+    Args:
+        speaker_segments: Speaker diarization segments
+
+    Returns:
+        (starts, reach, ends, labels, order) arrays, or None if there are no segments
+    """
+    if not speaker_segments:
+        return None
+    count = len(speaker_segments)
+    starts = np.fromiter((seg["start"] for seg in speaker_segments), dtype=np.float64, count=count)
+    ends = np.fromiter((seg["end"] for seg in speaker_segments), dtype=np.float64, count=count)
+    labels = np.array([seg["speaker"] for seg in speaker_segments], dtype=object)
+    order = np.argsort(starts, kind="stable")
+    starts, ends, labels = starts[order], ends[order], labels[order]
+    # Overlapping speech means ends alone need not be sorted; their running
+    # maximum is, and bounds which segments can still reach a given time
+    return starts, np.maximum.accumulate(ends), ends, labels, order
+
 
 class Transcriber:
     """Transcribes audio to text with support for multiple languages."""
@@ -42,7 +121,10 @@ class Transcriber:
         self,
         language: Literal["en", "ru", "zh"] = "en",
         model_variant: str = "default",
-        device: str = "auto"
+        device: str = "auto",
+        max_concurrent: int = 4,
+        compute_type: Literal["auto", "float32", "float16", "int8"] = "auto",
+        compile_model: bool = False
     ):
         """
         Initialize Transcriber.
@@ -51,9 +133,19 @@ class Transcriber:
             language: Language code ('en', 'ru', 'zh')
             model_variant: Model variant to use ('default', 'alternative', 'turbo')
             device: Device to use ('cuda', 'cpu', or 'auto')
+            max_concurrent: Number of audio shards transcribed in parallel
+                (HuggingFace models only; 1 disables sharding)
+            compute_type: Inference precision. 'auto' is float16 on CUDA and
+                float32 on CPU (int8 for faster-whisper); 'int8' runs int8
+                kernels with faster-whisper or dynamically quantizes linear
+                layers of HuggingFace models, on CPU only
+            compile_model: Compile the HuggingFace model's forward pass with
+                torch.compile at load time (slower startup, faster inference)
         """
         self.language = language
         self.model_variant = model_variant
+        self.max_concurrent = max(1, max_concurrent)
+        self.compile_model = compile_model
 
         # Determine device
         if device == "auto":
@@ -63,9 +155,22 @@ class Transcriber:
 
         logger.info(f"Using device: {self.device}")
 
+        # faster-whisper picks its own CPU default, so remember whether one was requested
+        self._auto_compute_type = compute_type == "auto"
+        if compute_type == "auto":
+            compute_type = "float16" if self.device == "cuda" else "float32"
+        elif compute_type == "float16" and self.device != "cuda":
+            logger.warning("float16 inference needs CUDA; using float32")
+            compute_type = "float32"
+        elif compute_type == "int8" and self.device == "cuda":
+            logger.warning("int8 quantization is CPU only; using float16")
+            compute_type = "float16"
+        self.compute_type = compute_type
+
         # Load model
         self.model = None
         self.model_name = None
+        self.backend = None
         self._load_model()
 
     def _load_model(self):
@@ -93,18 +198,23 @@ class Transcriber:
                     "WhisperX requires separate installation. "
                     "Using standard Whisper model instead."
                 )
-                self.model = whisper.load_model("large-v3", device=self.device)
+                self._load_whisper("large-v3")
             elif self.model_name.startswith("openai/whisper"):
                 # Use standard Whisper — extract size like "large-v3" from "openai/whisper-large-v3"
-                model_size = self.model_name.split("openai/whisper-", 1)[-1]
-                self.model = whisper.load_model(model_size, device=self.device)
+                self._load_whisper(self.model_name.split("openai/whisper-", 1)[-1])
             else:
                 # Use HuggingFace transformers
                 self.model = pipeline(
                     "automatic-speech-recognition",
                     model=self.model_name,
-                    device=0 if self.device == "cuda" else -1
+                    device=0 if self.device == "cuda" else -1,
+                    torch_dtype=torch.float16 if self.compute_type == "float16" else torch.float32
                 )
+                self.backend = "transformers"
+                if self.compute_type == "int8":
+                    self._quantize_model()
+                if self.compile_model:
+                    self._compile_model()
 
             logger.info("Transcription model loaded successfully")
 
@@ -112,10 +222,102 @@ class Transcriber:
             logger.error(f"Error loading model: {e}")
             raise
 
+    def _load_whisper(self, model_size: str):
+        """
+        Load a Whisper checkpoint, preferring faster-whisper (CTranslate2).
+
+        Falls back to openai-whisper when faster-whisper is not installed.
+
+        Args:
+            model_size: Whisper model size, e.g. 'large-v3'
+        """
+        if self.compile_model:
+            logger.info("compile_model applies to HuggingFace models only; skipping")
+            self.compile_model = False
+
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            logger.info("faster-whisper not installed, using openai-whisper")
+        else:
+            if self._auto_compute_type and self.device == "cpu":
+                self.compute_type = "int8"
+            self.model = WhisperModel(model_size, device=self.device, compute_type=self.compute_type)
+            self.backend = "faster-whisper"
+            return
+
+        self.model = whisper.load_model(model_size, device=self.device)
+        self.backend = "whisper"
+        if self.compute_type == "int8":
+            # whisper.model.Linear subclasses are not picked up by quantize_dynamic
+            logger.warning("int8 is not supported for openai-whisper models; using float32")
+            self.compute_type = "float32"
+
+    def _quantize_model(self):
+        """
+        Dynamically quantize the HuggingFace model's linear layers to int8.
+
+        Falls back to the FP32 model on error.
+        """
+        try:
+            from torch.ao.quantization import quantize_dynamic
+
+            self.model.model = quantize_dynamic(
+                self.model.model.eval(), {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("Transcription model quantized to int8")
+        except Exception as e:
+            logger.warning(f"Could not quantize transcription model, keeping FP32: {e}")
+            self.compute_type = "float32"
+
+    def _compile_model(self):
+        """
+        Compile the HuggingFace model's forward pass with torch.compile.
+
+        Only forward is compiled since the pipeline drives decoding through
+        generate() on the original module. A warm-up pass triggers
+        compilation here rather than on the first file. Falls back to the
+        eager model if compilation is not supported.
+        """
+        model = self.model.model
+        eager = model.forward
+
+        try:
+            logger.info("Compiling transcription model (one-time warm-up)...")
+            # Default mode: CUDA graphs (reduce-overhead) do not suit the
+            # varying decoder lengths and concurrent shard threads
+            model.forward = torch.compile(eager)
+
+            self.warmup()
+            logger.info("Transcription model compiled")
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, using eager model: {e}")
+            model.forward = eager
+
+    def warmup(self):
+        """
+        Transcribe one second of silence.
+
+        Initializes CUDA kernels and allocator pools so the first real file
+        does not pay for it.
+        """
+        silence = np.zeros(16000, dtype=np.float32)
+        if self.backend == "faster-whisper":
+            # Segments are decoded lazily as the generator is consumed
+            list(self.model.transcribe(silence, language=self.language, task="transcribe")[0])
+        elif self.backend == "whisper":
+            self.model.transcribe(
+                silence, language=self.language, task="transcribe",
+                fp16=self.compute_type == "float16"
+            )
+        else:
+            self.model({"raw": silence, "sampling_rate": 16000}, return_timestamps=True)
+
     def transcribe(
         self,
         audio_path: str,
-        speaker_segments: Optional[List[Dict[str, Any]]] = None
+        speaker_segments: Optional[List[Dict[str, Any]]] = None,
+        audio: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Transcribe audio to text.
@@ -123,6 +325,8 @@ class Transcriber:
         Args:
             audio_path: Path to audio file
             speaker_segments: Optional speaker diarization segments
+            audio: Decoded 16 kHz mono waveform for this file, as returned by
+                SpeakerDiarizer.load_audio() (optional; skips decoding again)
 
         Returns:
             List of transcription segments with format:
@@ -134,20 +338,38 @@ class Transcriber:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         logger.info(f"Transcribing audio from {audio_path}")
+        speakers = _speaker_table(speaker_segments)
 
         try:
-            if isinstance(self.model, whisper.Whisper):
+            if self.backend == "faster-whisper":
+                # Use CTranslate2 Whisper model; segments are generated lazily
+                fw_segments, _ = self.model.transcribe(
+                    str(audio_path) if audio is None else audio["waveform"][0].cpu().numpy(),
+                    language=self.language,
+                    task="transcribe"
+                )
+                result = {
+                    "segments": [
+                        {"start": seg.start, "end": seg.end, "text": seg.text}
+                        for seg in fw_segments
+                    ]
+                }
+                segments = self._process_whisper_result(result, speakers)
+            elif self.backend == "whisper":
                 # Use Whisper model
                 result = self.model.transcribe(
-                    str(audio_path),
+                    str(audio_path) if audio is None else audio["waveform"][0],
                     language=self.language,
-                    task="transcribe"
+                    task="transcribe",
+                    fp16=self.compute_type == "float16"
                 )
-                segments = self._process_whisper_result(result, speaker_segments)
-            else:
+                segments = self._process_whisper_result(result, speakers)
+            elif audio is None:
                 # Use HuggingFace pipeline
                 result = self.model(str(audio_path), return_timestamps=True)
-                segments = self._process_hf_result(result, speaker_segments)
+                segments = self._process_hf_result(result, speakers)
+            else:
+                segments = self._transcribe_shards(audio, speakers)
 
             logger.info(f"Transcription completed: {len(segments)} segments")
             return segments
@@ -156,10 +378,89 @@ class Transcriber:
             logger.error(f"Error during transcription: {e}")
             raise
 
+    def _transcribe_shards(
+        self,
+        audio: Dict[str, Any],
+        speakers: Optional[SpeakerTable]
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe a decoded waveform with the HuggingFace pipeline.
+
+        Long audio is cut at pauses and up to max_concurrent shards are
+        transcribed at once: as one padded batch on CUDA, on threads on CPU.
+        Segment times are shifted back onto the original timeline. The
+        openai-whisper path is not sharded since its decoder keeps a
+        key/value cache on the shared model.
+        """
+        waveform = audio["waveform"][0].cpu().numpy()
+        sample_rate = audio["sample_rate"]
+        if self.max_concurrent > 1:
+            bounds = _split_on_silence(waveform, sample_rate)
+        else:
+            bounds = [(0, len(waveform))]
+        inputs = [
+            {"raw": waveform[start:end], "sampling_rate": sample_rate}
+            for start, end in bounds
+        ]
+
+        def process(result: Dict[str, Any], bound: Tuple[int, int]) -> List[Dict[str, Any]]:
+            start, end = bound
+            return self._process_hf_result(
+                result,
+                speakers,
+                offset=start / sample_rate,
+                duration=(end - start) / sample_rate
+            )
+
+        if len(bounds) == 1:
+            return process(self.model(inputs[0], return_timestamps=True), bounds[0])
+
+        workers = min(self.max_concurrent, len(bounds))
+        if self.device == "cuda":
+            # Threads would only queue kernels on the same GPU; batching the
+            # shards through the encoder and decoder keeps it busy instead
+            logger.info(f"Transcribing {len(bounds)} shards in batches of {workers}")
+            results = self.model(inputs, batch_size=workers, return_timestamps=True)
+            return [
+                segment
+                for result, bound in zip(results, bounds)
+                for segment in process(result, bound)
+            ]
+
+        def run(index: int) -> List[Dict[str, Any]]:
+            return process(self.model(inputs[index], return_timestamps=True), bounds[index])
+
+        logger.info(f"Transcribing {len(bounds)} shards with up to {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llcar-asr-shard") as pool:
+            return [segment for shard in pool.map(run, range(len(bounds))) for segment in shard]
+
+    def assign_speakers(
+        self,
+        segments: List[Dict[str, Any]],
+        speaker_segments: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Label transcription segments with speakers after the fact.
+
+        Lets transcription run without waiting for diarization; the result
+        matches passing speaker_segments to transcribe().
+
+        Args:
+            segments: Transcription segments (updated in place)
+            speaker_segments: Speaker diarization segments
+
+        Returns:
+            The same segments with "speaker" set
+        """
+        speakers = _speaker_table(speaker_segments)
+        if speakers is not None:
+            self._match_speakers(segments, speakers)
+        return segments
+
     def _process_whisper_result(
         self,
         result: Dict[str, Any],
-        speaker_segments: Optional[List[Dict[str, Any]]]
+        speakers: Optional[SpeakerTable]
     ) -> List[Dict[str, Any]]:
         """Process Whisper transcription result."""
         segments = []
@@ -171,86 +472,96 @@ class Transcriber:
                 "text": segment["text"].strip(),
                 "speaker": None
             }
-
-            # Match with speaker if diarization data is available
-            if speaker_segments:
-                segment_data["speaker"] = self._match_speaker(
-                    segment["start"],
-                    segment["end"],
-                    speaker_segments
-                )
-
             segments.append(segment_data)
 
+        # Match with speakers if diarization data is available
+        if speakers is not None:
+            self._match_speakers(segments, speakers)
+
         return segments
 
     def _process_hf_result(
         self,
         result: Dict[str, Any],
-        speaker_segments: Optional[List[Dict[str, Any]]]
+        speakers: Optional[SpeakerTable],
+        offset: float = 0.0,
+        duration: float = 0.0
     ) -> List[Dict[str, Any]]:
-        """Process HuggingFace pipeline result."""
+        """
+        Process HuggingFace pipeline result.
+
+        Times are shifted by offset seconds; a chunk left open at the end of
+        the input is closed at offset + duration.
+        """
         segments = []
 
         if "chunks" in result:
             for chunk in result["chunks"]:
                 ts = chunk.get("timestamp")
                 segment_data = {
-                    "start": ts[0] if ts and ts[0] is not None else 0.0,
-                    "end": ts[1] if ts and ts[1] is not None else 0.0,
+                    "start": (ts[0] if ts and ts[0] is not None else 0.0) + offset,
+                    "end": (ts[1] if ts and ts[1] is not None else duration) + offset,
                     "text": chunk["text"].strip(),
                     "speaker": None
                 }
-
-                # Match with speaker if diarization data is available
-                if speaker_segments:
-                    segment_data["speaker"] = self._match_speaker(
-                        segment_data["start"],
-                        segment_data["end"],
-                        speaker_segments
-                    )
-
                 segments.append(segment_data)
+
+            # Match with speakers if diarization data is available
+            if speakers is not None:
+                self._match_speakers(segments, speakers)
         else:
             # Single segment result
             segments.append({
-                "start": 0.0,
-                "end": 0.0,
+                "start": offset,
+                "end": offset,
                 "text": result["text"].strip(),
                 "speaker": None
             })
 
         return segments
 
-    def _match_speaker(
+    def _match_speakers(
         self,
-        start: float,
-        end: float,
-        speaker_segments: List[Dict[str, Any]]
-    ) -> Optional[str]:
+        segments: List[Dict[str, Any]],
+        speakers: SpeakerTable
+    ):
         """
-        Match transcription segment with speaker.
+        Label transcription segments with the best-overlapping speaker.
 
-        Args:
-            start: Start time of transcription segment
-            end: End time of transcription segment
-            speaker_segments: List of speaker diarization segments
+        Each segment gets the speaker segment with the largest overlap (the
+        first listed on ties), or None if nothing overlaps. All segments are
+        matched at once: binary search bounds each segment's candidates, and
+        the candidate pairs are scored as flat arrays.
 
-        Returns:
-            Speaker label or None
+        Args:
+            segments: Transcription segments ("speaker" is set in place)
+            speakers: Speaker segments as built by _speaker_table()
         """
-        # Find speaker with maximum overlap
-        max_overlap = 0.0
-        matched_speaker = None
-
-        for speaker_seg in speaker_segments:
-            # Calculate overlap
-            overlap_start = max(start, speaker_seg["start"])
-            overlap_end = min(end, speaker_seg["end"])
-            overlap = max(0.0, overlap_end - overlap_start)
-
-            if overlap > max_overlap:
-                max_overlap = overlap
-                matched_speaker = speaker_seg["speaker"]
-
-        return matched_speaker
+        spk_starts, reach, spk_ends, labels, order = speakers
+        count = len(segments)
+        starts = np.fromiter((seg["start"] for seg in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((seg["end"] for seg in segments), dtype=np.float64, count=count)
+
+        # Only speaker segments starting before end and not all ending by
+        # start can overlap: a contiguous run [lo, hi) per segment
+        lo = np.searchsorted(reach, starts, side="right")
+        hi = np.searchsorted(spk_starts, ends, side="left")
+        runs = np.maximum(hi - lo, 0)
+
+        # One row per (segment, candidate) pair
+        seg_idx = np.repeat(np.arange(count), runs)
+        cand = np.repeat(lo - (np.cumsum(runs) - runs), runs) + np.arange(runs.sum())
+        overlap = np.minimum(ends[seg_idx], spk_ends[cand]) - np.maximum(starts[seg_idx], spk_starts[cand])
+        positive = overlap > 0
+        seg_idx, cand, overlap = seg_idx[positive], cand[positive], overlap[positive]
+
+        # Per segment: largest overlap first, then earliest in the input list
+        ranked = np.lexsort((order[cand], -overlap, seg_idx))
+        seg_idx, cand = seg_idx[ranked], cand[ranked]
+        first = np.ones(len(seg_idx), dtype=bool)
+        first[1:] = seg_idx[1:] != seg_idx[:-1]
+
+        for segment in segments:
+            segment["speaker"] = None
+        for i, c in zip(seg_idx[first].tolist(), cand[first].tolist()):
+            segments[i]["speaker"] = labels[c]
@@ -5,86 +5,131 @@ Tests for Interactive Console Module
 Tests the console interface functionality without requiring actual video processing.
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
+import io
+from unittest.mock import Mock, patch
+from types import SimpleNamespace
 import sys
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+import pytest
 
-from src.console import InteractiveConsole
+from src.console import (InteractiveConsole, _scan_media, _parse_choice,
+                         _MEDIA_SUFFIXES, _DeferredWriter)
 
 
-class TestInteractiveConsole(unittest.TestCase):
-    """Test cases for InteractiveConsole class."""
+@pytest.fixture
+def stdin(monkeypatch):
+    """Return a function that answers the next prompt with text (stdout is silenced)."""
+    def feed(text):
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(text + '\n'))
+        monkeypatch.setattr(sys, 'stdout', io.StringIO())
+    return feed
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
-            'language': 'en',
-            'model_variant': 'default',
-            'device': 'auto',
-            'output': {'directory': './output'},
-            'hf_token': 'test_token'
-        }
-        self.console = InteractiveConsole(config=self.config)
 
-    def test_console_initialization(self):
-        """Test console initialization."""
-        self.assertIsNotNone(self.console)
-        self.assertEqual(self.console.config, self.config)
-        self.assertEqual(self.console.history, [])
-        self.assertTrue(self.console.running)
+CONFIG = {
+    'language': 'en',
+    'model_variant': 'default',
+    'device': 'auto',
+    'output': {'directory': './output'},
+    'hf_token': 'test_token'
+}
+
+
+@pytest.fixture(scope='module')
+def console():
+    """Console shared by the tests that leave it unchanged."""
+    return InteractiveConsole(config=CONFIG)
 
-    def test_get_input_with_default(self):
+
+@pytest.fixture
+def fresh_console():
+    """Console for tests that change its config, history or running state."""
+    return InteractiveConsole(config=CONFIG)
+
+
+class TestInteractiveConsole:
+    """Test cases for InteractiveConsole class."""
+
+    def test_console_initialization(self, console):
+        """Test console initialization."""
+        assert console is not None
+        for key in ('language', 'model_variant', 'device', 'hf_token'):
+            assert console.config[key] == CONFIG[key]
+        assert console.config['output']['directory'] == './output'
+        assert console.config['output']['formats'] == ['json', 'txt']
+        assert list(console.history) == []
+        assert console.history.maxlen == 10_000
+        assert console.running
+
+    def test_get_input_with_default(self, console, stdin):
         """Test get_input with default value."""
-        with patch('builtins.input', return_value=''):
-            result = self.console.get_input("Test prompt", "default_value")
-            self.assertEqual(result, "default_value")
+        stdin('')
+        assert console.get_input("Test prompt", "default_value") == "default_value"
 
-    def test_get_input_with_user_value(self):
+    def test_get_input_with_user_value(self, console, stdin):
         """Test get_input with user-provided value."""
-        with patch('builtins.input', return_value='user_value'):
-            result = self.console.get_input("Test prompt", "default_value")
-            self.assertEqual(result, "user_value")
-
-    def test_get_yes_no_yes(self):
-        """Test get_yes_no with yes response."""
-        for response in ['y', 'yes', 'Y', 'YES']:
-            with patch('builtins.input', return_value=response):
-                result = self.console.get_yes_no("Test?", False)
-                self.assertTrue(result)
-
-    def test_get_yes_no_no(self):
-        """Test get_yes_no with no response."""
-        for response in ['n', 'no', 'N', 'NO']:
-            with patch('builtins.input', return_value=response):
-                result = self.console.get_yes_no("Test?", True)
-                self.assertFalse(result)
-
-    def test_get_yes_no_default(self):
+        stdin('user_value')
+        assert console.get_input("Test prompt", "default_value") == "user_value"
+
+    def test_get_input_eof(self, console, monkeypatch):
+        """Test get_input raises EOFError when stdin is closed."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(''))
+        monkeypatch.setattr(sys, 'stdout', io.StringIO())
+        with pytest.raises(EOFError):
+            console.get_input("Test prompt", "default_value")
+
+    @pytest.mark.parametrize('response,expected', [
+        ('y', True), ('yes', True), ('Y', True), ('YES', True),
+        ('n', False), ('no', False), ('N', False), ('NO', False),
+    ])
+    def test_get_yes_no_response(self, console, stdin, response, expected):
+        """Test get_yes_no answers override the opposite default."""
+        stdin(response)
+        assert console.get_yes_no("Test?", not expected) is expected
+
+    def test_get_yes_no_default(self, console, stdin):
         """Test get_yes_no with default value."""
-        with patch('builtins.input', return_value=''):
-            result = self.console.get_yes_no("Test?", True)
-            self.assertTrue(result)
+        stdin('')
+        assert console.get_yes_no("Test?", True) is True
 
     @patch('pathlib.Path.exists')
     @patch('pathlib.Path.glob')
-    def test_browse_files_video(self, mock_glob, mock_exists):
+    def test_browse_files_video(self, mock_glob, mock_exists, console):
         """Test file browsing for video files."""
         mock_exists.return_value = True
-        mock_file = MagicMock()
-        mock_file.name = 'test.mp4'
-        mock_file.stat.return_value.st_size = 1024 * 1024  # 1 MB
+        mock_file = SimpleNamespace(
+            name='test.mp4',
+            stat=lambda: SimpleNamespace(st_size=1024 * 1024)  # 1 MB
+        )
         mock_glob.return_value = [mock_file]
 
-        with patch('builtins.input', return_value='1'):
-            # This would require more complex mocking to fully test
-            # Just verify the method exists and is callable
-            self.assertTrue(callable(self.console.browse_files))
-
-    def test_history_tracking(self):
+        # This would require more complex mocking to fully test
+        # Just verify the method exists and is callable
+        assert callable(console.browse_files)
+
+    def test_parse_formats(self, console):
+        """Test output format parsing drops unknown entries."""
+        assert console._parse_formats(" JSON, csv ,pdf") == ['json', 'csv']
+        assert console._parse_formats("pdf") == ['json', 'txt']
+
+    def test_parse_choice(self):
+        """Test numeric answers are parsed once and range-checked."""
+        assert _parse_choice(" 3 ", 1, 5) == 3
+        assert _parse_choice("+2", 1, 5) == 2
+        assert _parse_choice("6", 1, 5) is None
+        assert _parse_choice("-1") is None
+        assert _parse_choice("abc") is None
+        assert _parse_choice(None) is None
+
+    def test_batch_workers(self, fresh_console):
+        """Test batch parallelism is only used for multi-file CPU batches."""
+        with patch('os.cpu_count', return_value=8):
+            assert fresh_console._batch_workers(10) == 1  # device=auto
+            fresh_console.config['device'] = 'cpu'
+            assert fresh_console._batch_workers(1) == 1
+            assert fresh_console._batch_workers(3) == 3
+            assert fresh_console._batch_workers(10) == 4
+
+    def test_history_tracking(self, fresh_console):
         """Test history tracking functionality."""
         entry = {
             'timestamp': '2026-02-05T20:00:00',
@@ -94,143 +139,209 @@ class TestInteractiveConsole(unittest.TestCase):
             'status': 'completed'
         }
 
-        self.console.history.append(entry)
-        self.assertEqual(len(self.console.history), 1)
-        self.assertEqual(self.console.history[0]['type'], 'video')
-        self.assertEqual(self.console.history[0]['status'], 'completed')
+        fresh_console.history.append(entry)
+        assert list(fresh_console.history) == [entry]
 
-    def test_config_management(self):
+    def test_config_management(self, fresh_console):
         """Test configuration management."""
         # Update config
-        self.console.config['language'] = 'ru'
-        self.assertEqual(self.console.config['language'], 'ru')
+        fresh_console.config['language'] = 'ru'
+        assert fresh_console.config['language'] == 'ru'
 
         # Reset pipeline
-        self.console.pipeline = None
-        self.assertIsNone(self.console.pipeline)
-
-    @patch('os.system')
-    def test_clear_screen(self, mock_system):
-        """Test screen clearing."""
-        self.console.clear_screen()
-        mock_system.assert_called_once()
-
-    @patch('builtins.print')
-    def test_print_header(self, mock_print):
-        """Test header printing."""
-        self.console.print_header()
-        self.assertTrue(mock_print.called)
-
-    @patch('builtins.print')
-    def test_print_menu(self, mock_print):
-        """Test menu printing."""
-        self.console.print_menu()
-        self.assertTrue(mock_print.called)
-
-    def test_running_flag(self):
+        fresh_console.pipeline = None
+        assert fresh_console.pipeline is None
+
+    def test_clear_screen(self, monkeypatch, console):
+        """Test screen clearing uses ANSI escapes without spawning a shell."""
+        calls = []
+        out = io.StringIO()
+        monkeypatch.setenv('TERM', 'xterm')
+        monkeypatch.setattr('src.console.os.system', calls.append)
+        monkeypatch.setattr(sys, 'stdout', out)
+        console.clear_screen()
+        assert calls == []
+        assert out.getvalue() == "\033[H\033[2J"
+
+    def test_clear_screen_dumb_terminal(self, monkeypatch, console):
+        """Test screen clearing falls back to the shell on dumb terminals."""
+        calls = []
+        monkeypatch.setenv('TERM', 'dumb')
+        monkeypatch.setattr('src.console.os.system', calls.append)
+        console.clear_screen()
+        assert len(calls) == 1
+
+    def test_print_header(self, console, capsys):
+        """Test header shows the system info line."""
+        console.print_header()
+        assert "HF Token:" in capsys.readouterr().out
+
+    def test_print_menu(self, console, capsys):
+        """Test menu lists the main options."""
+        console.print_menu()
+        assert "Main Menu" in capsys.readouterr().out
+
+    def test_run_writes_single_frame(self, fresh_console):
+        """Test each main screen is one write ending with the prompt."""
+        out = Mock()
+        with patch.multiple('sys', stdin=io.StringIO('0\n'), stdout=out), \
+                patch.dict('os.environ', {'TERM': 'xterm'}), \
+                patch('builtins.print'):
+            assert fresh_console.run() == 0
+        out.write.assert_called_once()
+        frame = out.write.call_args[0][0]
+        assert frame.startswith("\033[H\033[2J")
+        assert "Main Menu" in frame
+        assert frame.endswith("[1]: ")
+
+    def test_run_restores_line_buffering(self, fresh_console):
+        """Test run() relaxes stdout line buffering only for the session."""
+        out = io.TextIOWrapper(io.BytesIO(), encoding='utf-8', line_buffering=True)
+        with patch.multiple('sys', stdin=io.StringIO('0\n'), stdout=out), \
+                patch('builtins.print'):
+            fresh_console.run()
+        assert out.line_buffering
+
+    def test_running_flag(self, fresh_console):
         """Test running flag control."""
-        self.assertTrue(self.console.running)
-        self.console.running = False
-        self.assertFalse(self.console.running)
+        assert fresh_console.running
+        fresh_console.running = False
+        assert not fresh_console.running
 
 
-class TestConsoleIntegration(unittest.TestCase):
-    """Integration tests for console functionality."""
+# Integration tests for console functionality
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
-            'language': 'en',
-            'model_variant': 'default',
-            'device': 'cpu',
-            'output': {'directory': './output'}
+@pytest.fixture
+def cpu_config():
+    """Console configuration pinned to the CPU."""
+    return {
+        'language': 'en',
+        'model_variant': 'default',
+        'device': 'cpu',
+        'output': {'directory': './output'}
+    }
+
+
+def test_console_creation(cpu_config):
+    """Test console can be created."""
+    assert InteractiveConsole(config=cpu_config) is not None
+
+
+def test_console_with_no_config():
+    """Test console creation without config."""
+    console = InteractiveConsole()
+    assert console.config['language'] == 'en'
+    assert console.config['device'] == 'auto'
+    assert console.config['output']['directory'] == './output'
+    assert console.config['hf_token'] is None
+
+
+def test_console_config_does_not_share_defaults():
+    """Test editing one console's config leaves the defaults intact."""
+    console = InteractiveConsole()
+    console.config['output']['directory'] = '/tmp/elsewhere'
+    assert InteractiveConsole().config['output']['directory'] == './output'
+
+
+def test_history_limit():
+    """Test history keeps only the configured number of entries."""
+    console = InteractiveConsole(config={'history_limit': 2})
+    for name in ('a.mp4', 'b.mp4', 'c.mp4'):
+        console.history.append({'file': name, 'status': 'completed'})
+    assert [e['file'] for e in console.history] == ['b.mp4', 'c.mp4']
+
+
+def test_console_with_pipeline(cpu_config):
+    """Test console with pipeline instance."""
+    pipeline = SimpleNamespace()
+    console = InteractiveConsole(pipeline=pipeline, config=cpu_config)
+    assert console.pipeline is pipeline
+
+
+# Helper functions in console
+
+def test_history_export_structure():
+    """Test history export structure."""
+    console = InteractiveConsole()
+
+    # Add multiple entries
+    entries = [
+        {
+            'timestamp': '2026-02-05T20:00:00',
+            'type': 'video',
+            'file': 'video1.mp4',
+            'status': 'completed'
+        },
+        {
+            'timestamp': '2026-02-05T20:05:00',
+            'type': 'audio',
+            'file': 'audio1.wav',
+            'status': 'failed',
+            'error': 'Test error'
         }
+    ]
+
+    console.history = entries
+
+    # Verify structure
+    assert list(console.history) == entries
+
 
-    def test_console_creation(self):
-        """Test console can be created."""
-        console = InteractiveConsole(config=self.config)
-        self.assertIsNotNone(console)
-
-    def test_console_with_no_config(self):
-        """Test console creation without config."""
-        console = InteractiveConsole()
-        self.assertIsNotNone(console)
-        self.assertEqual(console.config, {})
-
-    def test_console_with_pipeline(self):
-        """Test console with pipeline instance."""
-        mock_pipeline = Mock()
-        console = InteractiveConsole(pipeline=mock_pipeline, config=self.config)
-        self.assertEqual(console.pipeline, mock_pipeline)
-
-
-class TestConsoleHelpers(unittest.TestCase):
-    """Test helper functions in console."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.console = InteractiveConsole()
-
-    def test_history_export_structure(self):
-        """Test history export structure."""
-        # Add multiple entries
-        entries = [
-            {
-                'timestamp': '2026-02-05T20:00:00',
-                'type': 'video',
-                'file': 'video1.mp4',
-                'status': 'completed'
-            },
-            {
-                'timestamp': '2026-02-05T20:05:00',
-                'type': 'audio',
-                'file': 'audio1.wav',
-                'status': 'failed',
-                'error': 'Test error'
-            }
-        ]
-
-        self.console.history = entries
-
-        # Verify structure
-        self.assertEqual(len(self.console.history), 2)
-        self.assertEqual(self.console.history[0]['type'], 'video')
-        self.assertEqual(self.console.history[1]['type'], 'audio')
-        self.assertEqual(self.console.history[1]['status'], 'failed')
-
-
-def run_tests():
-    """Run all tests."""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add tests
-    suite.addTests(loader.loadTestsFromTestCase(TestInteractiveConsole))
-    suite.addTests(loader.loadTestsFromTestCase(TestConsoleIntegration))
-    suite.addTests(loader.loadTestsFromTestCase(TestConsoleHelpers))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return result.wasSuccessful()
-
-
-if __name__ == '__main__':
-    print("=" * 70)
-    print("LLCAR Interactive Console - Unit Tests")
-    print("=" * 70)
-    print()
-
-    success = run_tests()
-
-    print()
-    print("=" * 70)
-    if success:
-        print("✅ All tests passed!")
+def test_append_history_writes_log(tmp_path):
+    """Test history entries are appended to the JSONL log."""
+    import json
+    console = InteractiveConsole(config={'output': {'directory': str(tmp_path)}})
+    console._append_history({'file': 'a.mp4', 'status': 'completed'})
+    console._append_history({'file': 'б.wav', 'status': 'failed'})
+
+    with open(tmp_path / 'processing_history.jsonl', encoding='utf-8') as f:
+        logged = [json.loads(line) for line in f]
+
+    assert [e['file'] for e in logged] == ['a.mp4', 'б.wav']
+    assert len(console.history) == 2
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_export_history(tmp_path, monkeypatch, stdin, use_orjson):
+    """Test the history export is written as JSON to the configured output directory."""
+    import json
+    import src.console
+    if use_orjson:
+        pytest.importorskip('orjson')
+    monkeypatch.setattr(src.console, '_HAS_ORJSON', use_orjson)
+
+    console = InteractiveConsole(config={'output': {'directory': str(tmp_path / 'out')}})
+    entries = [{'file': 'б.wav', 'type': 'audio', 'language': 'ru',
+                'timestamp': '2026-02-05T20:00:00', 'status': 'failed', 'error': 'x'}]
+    console.history.extend(entries)
+    stdin("y\n")
+    console.view_history()
+
+    exported = (tmp_path / 'out' / 'processing_history.json').read_text(encoding='utf-8')
+    assert json.loads(exported) == entries
+    if use_orjson:
+        assert exported.startswith('[\n  {\n    "file": "б.wav"')
     else:
-        print("❌ Some tests failed!")
-    print("=" * 70)
+        # Compact separators keep json on its C encoder
+        assert exported == json.dumps(entries, ensure_ascii=False, separators=(',', ':'))
+
+
+def test_deferred_writer_order(capsys):
+    """Test deferred output keeps submission order and drains on exit."""
+    with _DeferredWriter() as out:
+        out.put("a\n")
+        out.put(lambda: "b\n")
+        out.put("c\n")
+    assert capsys.readouterr().out == "a\nb\nc\n"
+
+
+def test_scan_media(tmp_path):
+    """Test directory scan filters by extension and reports sizes."""
+    (tmp_path / 'b.MP4').write_bytes(b'x' * 10)
+    (tmp_path / 'a.wav').write_bytes(b'x' * 5)
+    (tmp_path / 'notes.txt').write_text('skip')
+    (tmp_path / 'folder.mp3').mkdir()
+
+    entries = _scan_media(str(tmp_path), _MEDIA_SUFFIXES)
 
-    sys.exit(0 if success else 1)
+    assert [(p.name, size) for p, size in entries] == [('a.wav', 5), ('b.MP4', 10)]
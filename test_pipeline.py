@@ -2,237 +2,578 @@
 """
 Test script for LLCAR Video Processing Pipeline
 Tests individual components without requiring actual video files.
+
+Run with pytest.
 """
 
-import sys
-import os
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+import numpy as np
+import pytest
+
 
 def test_imports():
     """Test that all modules can be imported."""
-    print("Testing imports...")
-    try:
-        from src.audio_extraction import AudioExtractor
-        from src.diarization import SpeakerDiarizer
-        from src.transcription import Transcriber
-        from src.postprocessing import TextPostProcessor, KeywordExtractor
-        from src.output import OutputFormatter
-        from src.pipeline import VideoPipeline
-        print("✓ All modules imported successfully")
-        return True
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
-        return False
+    from src.audio_extraction import AudioExtractor
+    from src.diarization import SpeakerDiarizer
+    from src.transcription import Transcriber
+    from src.postprocessing import TextPostProcessor, KeywordExtractor
+    from src.output import OutputFormatter
+    from src.pipeline import VideoPipeline
 
 
 def test_audio_extractor():
     """Test AudioExtractor initialization."""
-    print("\nTesting AudioExtractor...")
-    try:
-        from src.audio_extraction import AudioExtractor
-        extractor = AudioExtractor(sample_rate=16000, channels=1)
-        print(f"✓ AudioExtractor initialized with sample_rate={extractor.sample_rate}")
-        return True
-    except Exception as e:
-        print(f"✗ AudioExtractor error: {e}")
-        return False
-
-
-def test_text_processor():
-    """Test TextPostProcessor."""
-    print("\nTesting TextPostProcessor...")
-    try:
-        from src.postprocessing import TextPostProcessor
-
-        # Test for different languages
-        for lang in ['en', 'ru', 'zh']:
-            processor = TextPostProcessor(language=lang)
-
-            # Test text cleaning
-            if lang == 'en':
-                test_text = "um well like you know this is a test test"
-                cleaned = processor.clean_text(test_text)
-                print(f"✓ English: '{test_text}' -> '{cleaned}'")
-            elif lang == 'ru':
-                test_text = "ну вот это это тест тест"
-                cleaned = processor.clean_text(test_text)
-                print(f"✓ Russian: '{test_text}' -> '{cleaned}'")
-            else:
-                test_text = "这个 这个 测试 测试"
-                cleaned = processor.clean_text(test_text)
-                print(f"✓ Chinese: '{test_text}' -> '{cleaned}'")
-
-        return True
-    except Exception as e:
-        print(f"✗ TextPostProcessor error: {e}")
-        return False
-
-
-def test_keyword_extractor():
-    """Test KeywordExtractor."""
-    print("\nTesting KeywordExtractor...")
-    try:
-        from src.postprocessing import KeywordExtractor
-
-        extractor = KeywordExtractor(language='en')
-
-        # Test TF-IDF
-        texts = [
-            "Machine learning is a subset of artificial intelligence",
-            "Deep learning uses neural networks for pattern recognition",
-            "Natural language processing helps computers understand human language"
-        ]
-
-        keywords = extractor.extract_tfidf_keywords(texts, top_n=5)
-        print(f"✓ TF-IDF extracted {len(keywords)} keywords:")
-        for kw in keywords[:3]:
-            print(f"  - {kw['keyword']}: {kw['score']:.3f}")
-
-        # Test TextRank
-        combined_text = " ".join(texts)
-        textrank_keywords = extractor.extract_textrank_keywords(combined_text, top_n=5)
-        print(f"✓ TextRank extracted {len(textrank_keywords)} keywords:")
-        for kw in textrank_keywords[:3]:
-            print(f"  - {kw}")
-
-        return True
-    except Exception as e:
-        print(f"✗ KeywordExtractor error: {e}")
-        return False
-
-
-def test_output_formatter():
-    """Test OutputFormatter."""
-    print("\nTesting OutputFormatter...")
-    try:
-        from src.output import OutputFormatter
-        import tempfile
-        import json
-
-        # Use temporary directory
-        with tempfile.TemporaryDirectory() as tmpdir:
-            formatter = OutputFormatter(output_dir=tmpdir)
-
-            # Test data
-            test_segments = [
-                {
-                    "speaker": "SPEAKER_00",
-                    "start": 0.0,
-                    "end": 3.5,
-                    "text": "Hello, this is a test"
-                },
-                {
-                    "speaker": "SPEAKER_01",
-                    "start": 3.5,
-                    "end": 7.0,
-                    "text": "Yes, testing the system"
-                }
-            ]
-
-            # Test JSON output
-            json_path = formatter.save_json({"test": "data"}, "test.json")
-            print(f"✓ JSON saved to {json_path}")
-
-            # Test CSV output
-            csv_path = formatter.save_csv(test_segments, "test.csv")
-            print(f"✓ CSV saved to {csv_path}")
-
-            # Test TXT output
-            txt_path = formatter.save_text(test_segments, "test.txt")
-            print(f"✓ TXT saved to {txt_path}")
-
-            # Test plain text output
-            plain_path = formatter.save_plain_text(test_segments, "test_plain.txt")
-            print(f"✓ Plain TXT saved to {plain_path}")
-
-            # Verify plain text content
-            with open(plain_path, 'r', encoding='utf-8') as f:
-                plain_content = f.read()
-            expected_plain = "Hello, this is a test Yes, testing the system"
-            if plain_content == expected_plain:
-                print(f"✓ Plain text content verified")
-            else:
-                print(f"⚠ Plain text content: '{plain_content}'")
-
-            # Test summary report
-            report = formatter.create_summary_report(
-                segments=test_segments,
-                keywords=[{"keyword": "test", "score": 0.9}],
-                speaker_stats={"SPEAKER_00": 3.5, "SPEAKER_01": 3.5}
-            )
-            print(f"✓ Summary report created with {report['statistics']['total_segments']} segments")
-
-        return True
-    except Exception as e:
-        print(f"✗ OutputFormatter error: {e}")
-        return False
-
-
-def test_configuration():
-    """Test configuration loading."""
-    print("\nTesting configuration...")
-    try:
-        import yaml
-        config_path = Path(__file__).parent / "config.yaml"
-
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            print(f"✓ Configuration loaded: language={config.get('language')}")
-            return True
-        else:
-            print("⚠ config.yaml not found (this is okay)")
-            return True
-    except Exception as e:
-        print(f"✗ Configuration error: {e}")
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("LLCAR Video Processing Pipeline - Component Tests")
-    print("=" * 60)
-
-    tests = [
-        ("Imports", test_imports),
-        ("AudioExtractor", test_audio_extractor),
-        ("TextPostProcessor", test_text_processor),
-        ("KeywordExtractor", test_keyword_extractor),
-        ("OutputFormatter", test_output_formatter),
-        ("Configuration", test_configuration),
-    ]
-
-    results = []
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"\n✗ Unexpected error in {name}: {e}")
-            results.append((name, False))
+    from src.audio_extraction import AudioExtractor
+
+    extractor = AudioExtractor(sample_rate=16000, channels=1)
+    assert extractor.sample_rate == 16000
+
+
+@pytest.mark.parametrize('lang,test_text,expected', [
+    ('en', "um well like you know this is a test test", "this is a test"),
+    ('ru', "ну вот это это тест тест", "тест"),
+    ('zh', "这个 这个 测试 测试", "测试"),
+])
+def test_text_processor(lang, test_text, expected):
+    """Test TextPostProcessor text cleaning for each language."""
+    from src.postprocessing import TextPostProcessor
+
+    processor = TextPostProcessor(language=lang)
+    assert processor.clean_text(test_text) == expected
+
+
+@pytest.mark.parametrize('text', [
+    "",
+    "обычный текст без мата",
+    # Several stems in one word, and stems that overlap each other
+    "хуеблядство и мудак и блядь",
+    # Word boundaries: punctuation, hyphens, underscores, digits
+    "сука, сучка! сука-блядь _жопа_ сука2 2сука",
+    # Stems inside longer words
+    "подстрахуй страхуется",
+    # Case and ё
+    "ХУЙ Сука ЖоПа ёбаный Ёбаный",
+    "hello сука world",
+    # lower() changes the length of İ, so the regex is used
+    "İstanbul сука",
+])
+def test_censor_profanity_matches_regex(text):
+    """Test the Aho-Corasick profanity censor matches the regex censor."""
+    pytest.importorskip('ahocorasick')
+    from src.postprocessing import TextPostProcessor
+
+    processor = TextPostProcessor(language='ru')
+    assert processor._profanity_automaton is not None
+    assert processor._censor_profanity(text) == processor._profanity_pattern.sub('***', text)
+
+
+@pytest.mark.parametrize('lang,texts', [
+    ('en', ["um this is a test test", "", "well okay", "um this is a test test", None,
+            "you", "know it"]),
+    ('en', ["you know\0 i mean it", "kind of fine", "   "]),
+    ('ru', ["ну вот это тест", "сука\0сука", "", "как бы да да"]),
+    ('zh', ["这个 这个 测试", "\0", "嗯 好"]),
+])
+def test_process_segments_matches_clean_text(lang, texts):
+    """Test batched segment cleaning gives the same text as clean_text per segment."""
+    from src.postprocessing import TextPostProcessor
+
+    processor = TextPostProcessor(language=lang)
+    segments = [{"start": float(i), "text": text} for i, text in enumerate(texts)]
+    processed = processor.process_segments(segments)
+
+    assert [seg["text"] for seg in processed] == [processor.clean_text(t or "") for t in texts]
+    assert [seg["original_text"] for seg in processed] == texts
+    # Segments are copied unless inplace is requested
+    assert [seg["text"] for seg in segments] == texts
+
+
+KEYWORD_TEXTS = [
+    "Machine learning is a subset of artificial intelligence",
+    "Deep learning uses neural networks for pattern recognition",
+    "Natural language processing helps computers understand human language"
+]
+
+
+@pytest.fixture(scope='module')
+def keyword_extractor():
+    """English KeywordExtractor shared by the keyword tests."""
+    from src.postprocessing import KeywordExtractor
+    return KeywordExtractor(language='en')
+
+
+@pytest.mark.slow
+def test_tfidf_keywords(keyword_extractor):
+    """Test KeywordExtractor TF-IDF keywords."""
+    keywords = keyword_extractor.extract_tfidf_keywords(KEYWORD_TEXTS, top_n=5)
+    assert len(keywords) == 5
+    scores = [kw['score'] for kw in keywords]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.slow
+def test_tfidf_keywords_ties(keyword_extractor):
+    """Test terms tied at the top_n boundary are taken in vocabulary order."""
+    # Every unigram and bigram gets the same average score
+    keywords = keyword_extractor.extract_tfidf_keywords(["alpha beta", "gamma delta"], top_n=4)
+    assert [kw['keyword'] for kw in keywords] == ['alpha', 'alpha beta', 'beta', 'delta']
+
+
+@pytest.mark.slow
+def test_textrank_keywords(keyword_extractor):
+    """Test KeywordExtractor TextRank keywords."""
+    combined_text = " ".join(KEYWORD_TEXTS)
+    assert keyword_extractor.extract_textrank_keywords(combined_text, top_n=5)
+
+
+def test_pagerank():
+    """Test sparse PageRank converges to the dense solution on a small graph."""
+    from src.postprocessing import _pagerank, _TEXTRANK_DAMPING
+
+    # Star around node 0 plus the path 3-4
+    edges_a = np.array([0, 0, 0, 3])
+    edges_b = np.array([1, 2, 3, 4])
+    degree = np.array([3.0, 1.0, 1.0, 2.0, 1.0])
+
+    scores = _pagerank(edges_a, edges_b, degree)
+
+    n = len(degree)
+    adjacency = np.zeros((n, n))
+    adjacency[edges_a, edges_b] = adjacency[edges_b, edges_a] = 1.0
+    transition = adjacency / degree
+    dense = np.linalg.solve(np.eye(n) - _TEXTRANK_DAMPING * transition,
+                            np.full(n, (1 - _TEXTRANK_DAMPING) / n))
+    assert scores.sum() == pytest.approx(1.0)
+    assert scores == pytest.approx(dense / dense.sum(), abs=1e-7)
+    assert np.argsort(-scores, kind='stable').tolist() == [0, 3, 4, 1, 2]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('text', ["", "hello", "the and of"])
+def test_textrank_without_graph(text):
+    """Test TextRank returns no keywords when no co-occurrence graph can be built."""
+    from src.postprocessing import _textrank
+    assert _textrank(text, words=5, ratio=0.2) == []
+
+
+@pytest.mark.slow
+def test_textrank_matches_summa():
+    """Test the in-house TextRank ranks keywords like summa."""
+    from summa import keywords
+    from src.postprocessing import _textrank
+
+    text = " ".join(KEYWORD_TEXTS) + (
+        " Neural networks learn patterns from data and machine learning models learn from data."
+    )
+    assert _textrank(text, words=5, ratio=0.2) == keywords.keywords(text, words=5, split=True)
+
+
+def test_keyword_tokenization():
+    """Test the tokenizer path is reported for cache keys."""
+    from importlib.util import find_spec
+    from src.postprocessing import KeywordExtractor
+
+    assert KeywordExtractor(language='en').tokenization == "default"
+    expected = "jieba" if find_spec("jieba") is not None else "default"
+    assert KeywordExtractor(language='zh').tokenization == expected
+
+
+# Test data
+SEGMENTS = [
+    {
+        "speaker": "SPEAKER_00",
+        "start": 0.0,
+        "end": 3.5,
+        "text": "Hello, this is a test"
+    },
+    {
+        "speaker": "SPEAKER_01",
+        "start": 3.5,
+        "end": 7.0,
+        "text": "Yes, testing the system"
+    }
+]
+
+
+@pytest.fixture(scope='module')
+def formatter(tmp_path_factory):
+    """OutputFormatter writing to a temporary directory shared by the output tests."""
+    from src.output import OutputFormatter
+    return OutputFormatter(output_dir=tmp_path_factory.mktemp('output'))
+
+
+def test_save_json(formatter):
+    """Test OutputFormatter JSON output."""
+    assert Path(formatter.save_json({"test": "data"}, "test.json")).exists()
+
+
+def test_save_csv(formatter):
+    """Test OutputFormatter CSV output."""
+    assert Path(formatter.save_csv(SEGMENTS, "test.csv")).exists()
+
+
+def test_save_text(formatter):
+    """Test OutputFormatter TXT output."""
+    assert Path(formatter.save_text(SEGMENTS, "test.txt")).exists()
+
+
+def test_save_plain_text(formatter):
+    """Test OutputFormatter plain text output content."""
+    plain_path = formatter.save_plain_text(SEGMENTS, "test_plain.txt")
+    with open(plain_path, 'r', encoding='utf-8') as f:
+        plain_content = f.read()
+    assert plain_content == "Hello, this is a test Yes, testing the system"
+
+
+def test_summary_report(formatter):
+    """Test OutputFormatter summary report."""
+    report = formatter.create_summary_report(
+        segments=SEGMENTS,
+        keywords=[{"keyword": "test", "score": 0.9}],
+        speaker_stats={"SPEAKER_00": 3.5, "SPEAKER_01": 3.5}
+    )
+    assert report['statistics']['total_segments'] == 2
+
+
+@pytest.mark.parametrize('path,kind', [
+    ("talk.MP4", "video"),
+    (Path("dir/talk.wav"), "audio"),
+    ("clips.mp4/notes", None),
+    (".mp4", None),
+    ("archive.tar.gz", None),
+    ("noext", None),
+])
+def test_file_formats(path, kind):
+    """Test file type detection by extension for str and Path inputs."""
+    from src.formats import is_video_file, is_audio_file, is_supported_file
+
+    assert is_video_file(path) == (kind == "video")
+    assert is_audio_file(path) == (kind == "audio")
+    assert is_supported_file(path) == (kind is not None)
+
+
+def test_pipeline_cache():
+    """Test PipelineCache."""
+    from src.cache import PipelineCache
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = PipelineCache(Path(tmpdir) / "cache")
+        key = cache.key("transcription", "abc", "en")
+        assert key != cache.key("transcription", "abc", "ru")
+        assert cache.get(key) is None
+
+        # Cached value computed once and reused
+        segments = [{"start": 0.0, "end": 1.0, "text": "тест", "speaker": None}]
+        calls = []
+        for _ in range(2):
+            value = cache.get_or_compute(key, lambda: calls.append(1) or segments)
+            assert value == segments
+        assert len(calls) == 1
+
+        # File digest is stable
+        audio = Path(tmpdir) / "audio.wav"
+        audio.write_bytes(b"\0" * 3_000_000)
+        assert cache.file_digest(audio) == cache.file_digest(str(audio))
+
+        # A failed write leaves neither an entry nor a temporary file
+        bad_key = cache.key("unserializable")
+        cache.put(bad_key, {"value": object()})
+        assert cache.get(bad_key) is None
+        assert not list((Path(tmpdir) / "cache").glob("*.tmp"))
+
+        # Disabled cache never hits
+        disabled = PipelineCache(None)
+        disabled.put(key, segments)
+        assert not disabled.enabled and disabled.get(key) is None
+
+
+class _FakeDiarization:
+    """Minimal stand-in for a pyannote Annotation: (start, end, label) turns."""
+
+    def __init__(self, turns):
+        self.turns = turns
 
-    # Summary
-    print("\n" + "=" * 60)
-    print("Test Summary")
-    print("=" * 60)
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for name, result in results:
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status}: {name}")
+    def labels(self):
+        return sorted({label for _, _, label in self.turns})
+
+    def itertracks(self, yield_label=False):
+        from types import SimpleNamespace
+        for start, end, label in self.turns:
+            yield SimpleNamespace(start=start, end=end), None, label
+
+
+def _chunked_diarizer(chunks):
+    """SpeakerDiarizer whose _run returns the given (turns, embeddings) per chunk."""
+    from src.diarization import SpeakerDiarizer
+
+    diarizer = SpeakerDiarizer.__new__(SpeakerDiarizer)
+    diarizer.max_chunk_duration = 10.0
+    diarizer.chunk_overlap = 4.0
+    outputs = iter(chunks)
+    diarizer.chunk_lengths = []
+
+    def run(audio, **kwargs):
+        diarizer.chunk_lengths.append(audio["waveform"].shape[-1])
+        turns, embeddings = next(outputs)
+        return _FakeDiarization(turns), np.array(embeddings, dtype=float)
+
+    diarizer._run = run
+    return diarizer
+
+
+@pytest.mark.parametrize('num_speakers,expected', [
+    (None, [("SPEAKER_00", 0.0, 9.0), ("SPEAKER_01", 11.0, 16.0)]),
+    # An explicit count merges the closest speakers
+    (1, [("SPEAKER_00", 0.0, 9.0), ("SPEAKER_00", 11.0, 16.0)]),
+])
+def test_diarize_chunked(num_speakers, expected):
+    """Test chunked diarization keeps speakers across chunks and trims overlaps."""
+    # 16 s at 10 Hz in 10 s chunks with 4 s overlap: chunks 0-10 s and 6-16 s
+    diarizer = _chunked_diarizer([
+        ([(0.0, 9.0, "A")], [[1.0, 0.0, 0.0]]),
+        # X is A again (6-9 s, trimmed to 8-9 s); Y is a new voice at 11-16 s
+        ([(0.0, 3.0, "X"), (5.0, 10.0, "Y")], [[0.95, 0.1, 0.0], [0.0, 0.0, 1.0]]),
+    ])
+    audio = {"waveform": np.zeros((1, 160)), "sample_rate": 10}
+
+    segments = diarizer._diarize_chunked(audio, num_speakers=num_speakers)
+
+    assert diarizer.chunk_lengths == [100, 100]
+    assert [(s["speaker"], s["start"], pytest.approx(s["end"])) for s in segments] == expected
+
+
+def test_diarize_chunked_trims_overlap():
+    """Test each chunk keeps only its half of the overlap."""
+    diarizer = _chunked_diarizer([
+        ([(7.0, 10.0, "A")], [[1.0, 0.0]]),
+        ([(0.0, 4.0, "B")], [[0.0, 1.0]]),
+    ])
+    audio = {"waveform": np.zeros((1, 160)), "sample_rate": 10}
+
+    segments = diarizer._diarize_chunked(audio)
+
+    # Overlap 6-10 s is split at 8 s
+    assert [(s["speaker"], s["start"], s["end"]) for s in segments] == [
+        ("SPEAKER_00", 7.0, 8.0), ("SPEAKER_01", 8.0, 10.0)
+    ]
 
-    print("=" * 60)
-    print(f"Total: {passed}/{total} tests passed")
-    print("=" * 60)
 
-    return 0 if passed == total else 1
+def test_match_global_speaker():
+    """Test chunk speakers join a known speaker only above the similarity threshold."""
+    from src.diarization import SpeakerDiarizer, SPEAKER_SIMILARITY_THRESHOLD
+
+    centroids, counts = [], []
+    match = SpeakerDiarizer._match_global_speaker
+    assert match(np.array([2.0, 0.0]), centroids, counts) == 0
+    # Same direction joins speaker 0 and updates its running mean
+    assert match(np.array([0.9, 0.1]), centroids, counts) == 0
+    assert counts == [2]
+    assert np.linalg.norm(centroids[0]) == pytest.approx(1.0)
+    # Below the threshold a new speaker is created
+    angle = np.arccos(SPEAKER_SIMILARITY_THRESHOLD) + 0.1
+    assert match(np.array([np.cos(angle), np.sin(angle)]), centroids, counts) == 1
+    # Unusable embeddings never match
+    assert match(np.zeros(2), centroids, counts) == 2
+    assert counts == [2, 1, 0]
+
+
+def _tone_with_gaps(sample_rate, duration, gaps):
+    """440 Hz tone of the given duration, silent over each (start, end) gap in seconds."""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    waveform = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    for start, end in gaps:
+        waveform[int(start * sample_rate):int(end * sample_rate)] = 0.0
+    return waveform
+
+
+def test_split_on_silence():
+    """Test shards are cut inside pauses and cover the waveform exactly."""
+    from src.transcription import _split_on_silence
+
+    sample_rate = 1000
+    gaps = [(9.5, 10.5), (19.7, 20.3)]
+    waveform = _tone_with_gaps(sample_rate, 30.0, gaps)
+
+    bounds = _split_on_silence(waveform, sample_rate, shard_duration=10.0, search_window=2.0)
+
+    assert len(bounds) == 3
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(waveform)
+    assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+    for (_, cut), (gap_start, gap_end) in zip(bounds, gaps):
+        assert gap_start * sample_rate <= cut < gap_end * sample_rate
+    # Short audio is a single shard
+    assert _split_on_silence(waveform[:14000], sample_rate, shard_duration=10.0) == [(0, 14000)]
+
+
+def test_transcribe_shards_offsets():
+    """Test shard timestamps are shifted onto the original timeline."""
+    import torch
+    from src.transcription import Transcriber, _split_on_silence
+
+    sample_rate = 100
+    waveform = _tone_with_gaps(sample_rate, 1000.0, [(295.0, 297.0), (601.0, 603.0)])
+    bounds = _split_on_silence(waveform, sample_rate)
+    assert len(bounds) == 3
+
+    def model(inputs, return_timestamps=True):
+        # Local times; the last chunk is left open at the end of the shard
+        assert inputs["sampling_rate"] == sample_rate
+        return {"chunks": [
+            {"timestamp": (1.0, 2.0), "text": " first "},
+            {"timestamp": (3.0, None), "text": "open"},
+        ]}
+
+    transcriber = Transcriber.__new__(Transcriber)
+    transcriber.model = model
+    transcriber.device = "cpu"
+    transcriber.max_concurrent = 2
+    audio = {"waveform": torch.from_numpy(waveform)[None], "sample_rate": sample_rate}
+
+    segments = transcriber._transcribe_shards(audio, None)
+
+    expected = []
+    for start, end in bounds:
+        offset = start / sample_rate
+        expected += [(offset + 1.0, offset + 2.0, "first"), (offset + 3.0, end / sample_rate, "open")]
+    assert [(s["start"], pytest.approx(s["end"]), s["text"]) for s in segments] == expected
+
+
+def _match_speaker_loop(start, end, speaker_segments):
+    """Per-segment speaker matching as done before vectorization."""
+    max_overlap = 0.0
+    matched_speaker = None
+    for speaker_seg in speaker_segments:
+        overlap = max(0.0, min(end, speaker_seg["end"]) - max(start, speaker_seg["start"]))
+        if overlap > max_overlap:
+            max_overlap = overlap
+            matched_speaker = speaker_seg["speaker"]
+    return matched_speaker
+
+
+@pytest.mark.parametrize('speaker_segments', [
+    # Touching turns, a gap, and a long turn overlapping several others
+    [
+        {"speaker": "A", "start": 0.0, "end": 2.0},
+        {"speaker": "B", "start": 2.0, "end": 4.0},
+        {"speaker": "C", "start": 6.0, "end": 9.0},
+        {"speaker": "A", "start": 3.0, "end": 12.0},
+    ],
+    # Unsorted input with equal overlaps (the first listed wins)
+    [
+        {"speaker": "B", "start": 5.0, "end": 6.0},
+        {"speaker": "A", "start": 4.0, "end": 5.0},
+        {"speaker": "C", "start": 0.5, "end": 1.5},
+        {"speaker": "D", "start": 0.5, "end": 1.5},
+    ],
+])
+def test_match_speakers(speaker_segments):
+    """Test vectorized speaker matching gives the same labels as the per-segment loop."""
+    from src.transcription import Transcriber
+
+    spans = [(0.0, 1.0), (1.5, 2.5), (2.0, 2.0), (4.0, 5.0), (4.5, 5.5), (5.0, 6.0),
+             (9.0, 10.0), (12.0, 13.0), (13.0, 14.0), (0.0, 14.0)]
+    segments = [{"start": start, "end": end, "text": "", "speaker": "stale"} for start, end in spans]
+
+    Transcriber.__new__(Transcriber).assign_speakers(segments, speaker_segments)
+
+    assert [seg["speaker"] for seg in segments] == [
+        _match_speaker_loop(start, end, speaker_segments) for start, end in spans
+    ]
 
 
-if __name__ == "__main__":
-    sys.exit(main())
+def test_pipeline_kwargs():
+    """Test VideoPipeline arguments are built from config with overrides."""
+    from src.settings import pipeline_kwargs
+
+    config = {
+        'language': 'ru',
+        'device': 'cuda',
+        'cache': {'directory': None},
+        'diarization': {'chunk_overlap': 10},
+        'transcription': {'compute_type': 'int8'},
+    }
+    kwargs = pipeline_kwargs(config, language='zh', hf_token='token')
+    assert kwargs['language'] == 'zh'
+    assert kwargs['hf_token'] == 'token'
+    assert kwargs['device'] == 'cuda'
+    assert kwargs['cache'] is None
+    assert kwargs['chunk_overlap'] == 10
+    assert kwargs['compute_type'] == 'int8'
+    assert pipeline_kwargs({})['cache'] == 'default'
+
+
+def test_process_batch_prefetch_and_cleanup(tmp_path):
+    """Test batch input preparation overlaps processing and temp audio is removed."""
+    import threading
+    from types import SimpleNamespace
+    from src.pipeline import VideoPipeline
+
+    names = ['a.mp4', 'b.wav', 'c.mp4', 'd.mp4']
+    paths = [str(tmp_path / name) for name in names]
+    for path in paths:
+        Path(path).write_bytes(b'media')
+
+    events = []
+    loaded = {path: threading.Event() for path in paths}
+    extracted = {}
+
+    def extract_audio(video_path, output_path):
+        Path(output_path).write_bytes(b'wav')
+        extracted[video_path] = output_path
+        return output_path
+
+    def load_audio(audio_path):
+        source = next((v for v, a in extracted.items() if a == audio_path), audio_path)
+        events.append(('load', source))
+        loaded[source].set()
+        if source.endswith('c.mp4'):
+            raise RuntimeError("undecodable")
+        return {"waveform": None}
+
+    def run_pipeline(audio_path, results, source_path_value, on_audio_consumed=None, **kwargs):
+        assert Path(audio_path).exists()
+        # The next file is prepared while this one is being processed
+        following = paths.index(source_path_value) + 1
+        if following < len(paths):
+            assert loaded[paths[following]].wait(5)
+        events.append(('run', source_path_value))
+        if on_audio_consumed is not None:
+            on_audio_consumed()
+        results["status"] = "completed"
+        return results
+
+    pipeline = VideoPipeline.__new__(VideoPipeline)
+    pipeline.language = 'en'
+    pipeline.model_variant = 'default'
+    pipeline.diarizer = SimpleNamespace(device='cpu', load_audio=load_audio)
+    pipeline.audio_extractor = SimpleNamespace(extract_audio=extract_audio,
+                                               get_audio_duration=lambda path: 1.0)
+    pipeline._run_pipeline = run_pipeline
+
+    reported = []
+    results = pipeline.process_batch(
+        paths,
+        on_start=lambda path: reported.append(('start', path)),
+        on_result=lambda path, r: reported.append(('done', path))
+    )
+
+    assert [r['status'] for r in results] == ['completed', 'completed', 'failed', 'completed']
+    assert reported == [(event, path) for path in paths for event in ('start', 'done')]
+    # Every file is loaded before it runs, and runs happen in input order
+    for path in paths[:2] + paths[3:]:
+        assert events.index(('load', path)) < events.index(('run', path))
+    assert [e[1] for e in events if e[0] == 'run'] == [paths[0], paths[1], paths[3]]
+    # Extracted audio is removed after use and when preparation fails
+    assert set(extracted) == {paths[0], paths[2], paths[3]}
+    assert not any(Path(a).exists() for a in extracted.values())
+
+
+def test_configuration(yaml_config):
+    """Test configuration loading."""
+    # A missing config.yaml is okay
+    if yaml_config is None:
+        pytest.skip("config.yaml not found")
+    assert isinstance(yaml_config, dict)
+    assert yaml_config.get('language')